@@ -10,9 +10,7 @@ import os
 # Add current directory to path
 sys.path.insert(0, os.path.dirname(__file__))
 
-from src.orchestrator import DealershipAssistant
 import argparse
-import asyncio
 
 
 def main():
@@ -44,7 +42,7 @@ Examples:
     parser.add_argument(
         "--voice-provider",
         default="local",
-        choices=["openai", "azure", "google", "local"],
+        choices=["openai", "azure", "google", "local", "faster-whisper"],
         help="Voice provider to use (default: local)",
     )
     parser.add_argument(
@@ -73,6 +71,12 @@ Examples:
         default=8000,
         help="Port for API server (default: 8000)",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=int(os.getenv("WEB_CONCURRENCY", "1")),
+        help="Number of API server worker processes (default: $WEB_CONCURRENCY or 1)",
+    )
 
     args = parser.parse_args()
 
@@ -93,14 +97,19 @@ Examples:
         print(f"🎯 ReDoc at http://localhost:{args.port}/redoc")
         print("\nPress Ctrl+C to stop the server\n")
 
+        # uvicorn's default loop/http ("auto") pick uvloop and httptools when installed
         uvicorn.run(
             "src.api:app",
             host="0.0.0.0",
             port=args.port,
             reload=False,
+            workers=args.workers,
         )
         return
 
+    # Heavy imports (LangChain, OpenAI) are deferred until an assistant is needed
+    from src.orchestrator import DealershipAssistant
+
     # Initialize assistant
     print("\n" + "="*70)
     print(" "*15 + "🚗 AUTO DEALERSHIP VOICE ASSISTANT 🎤")
@@ -117,6 +126,7 @@ Examples:
     # Run interaction
     try:
         if args.voice:
+            import asyncio
             asyncio.run(assistant.run_voice_interaction())
         else:
             assistant.run_text_interaction()
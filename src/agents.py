@@ -3,24 +3,202 @@ Multi-agent system for auto dealership test drive booking.
 Implements Conversation Agent, Knowledge Agent, and Booking Agent.
 """
 
+import functools
+import itertools
 import json
 import os
-from datetime import datetime, timedelta
-from typing import Optional, Dict, List, Any
+import re
+import secrets
+import time
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from typing import Optional, Dict, List, Any, Callable, Tuple
 from pathlib import Path
-from pydantic import BaseModel, Field
+import httpx
+from pydantic import BaseModel, ConfigDict, Field
 from langchain.tools import tool, Tool
 from langchain.agents import Tool as LangchainTool
 from langchain_openai import ChatOpenAI
 from langchain.prompts import ChatPromptTemplate, MessagesPlaceholder
-from langchain.memory import ConversationBufferMemory
+from langchain.memory import ConversationBufferWindowMemory
 from langchain.agents import AgentExecutor, create_openai_functions_agent
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# ==================== LLM Cache ====================
+
+_llm_cache_configured = False
+
+
+def configure_llm_cache() -> None:
+    """
+    Install a process-wide LangChain LLM cache (idempotent).
+
+    Uses an exact-match cache, in Redis when REDIS_URL is set and otherwise in
+    SQLite at LLM_CACHE_PATH. Set LLM_CACHE=false to disable caching.
+
+    The cache is never semantic: agent prompts are dominated by the shared system
+    prompt, so a similarity match could replay a tool call (e.g. book_test_drive)
+    carrying another customer's car, date or name.
+    """
+    global _llm_cache_configured
+    if _llm_cache_configured:
+        return
+    _llm_cache_configured = True
+
+    if os.getenv("LLM_CACHE", "true").lower() != "true":
+        return
+
+    from langchain.globals import set_llm_cache
+
+    redis_url = os.getenv("REDIS_URL")
+    if redis_url:
+        from langchain_community.cache import RedisCache
+        from redis import Redis
+
+        set_llm_cache(RedisCache(redis_=Redis.from_url(redis_url)))
+    else:
+        from langchain_community.cache import SQLiteCache
+
+        set_llm_cache(SQLiteCache(database_path=os.getenv("LLM_CACHE_PATH", ".langchain.db")))
+
+
+# ==================== Shared LLM Clients ====================
+
+try:
+    import h2  # noqa: F401  (HTTP/2 support for httpx)
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
+
+# httpx drops idle connections after 5 s by default, shorter than a typical
+# pause between conversation turns; keep them long enough to skip the TLS handshake
+_HTTP_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=50,
+    keepalive_expiry=float(os.getenv("HTTP_KEEPALIVE_SECONDS", "60")),
+)
+
+
+@functools.lru_cache(maxsize=None)
+def shared_http_client() -> httpx.Client:
+    """Return the process-wide sync HTTP client for outbound provider calls."""
+    return httpx.Client(http2=_HTTP2, limits=_HTTP_LIMITS)
+
+
+@functools.lru_cache(maxsize=None)
+def shared_async_http_client() -> httpx.AsyncClient:
+    """Return the process-wide async HTTP client for outbound provider calls."""
+    return httpx.AsyncClient(http2=_HTTP2, limits=_HTTP_LIMITS)
+
+
+async def close_http_clients() -> None:
+    """
+    Close the shared HTTP clients (call once on shutdown).
+
+    The cached LLMs built on them are dropped as well, so a later startup in
+    the same process builds fresh clients instead of reusing closed ones.
+    """
+    if shared_async_http_client.cache_info().currsize:
+        await shared_async_http_client().aclose()
+    if shared_http_client.cache_info().currsize:
+        shared_http_client().close()
+
+    make_llm.cache_clear()
+    shared_async_http_client.cache_clear()
+    shared_http_client.cache_clear()
+
+
+@functools.lru_cache(maxsize=None)
+def make_llm(model_name: str = "gpt-4") -> ChatOpenAI:
+    """
+    Return the process-wide ChatOpenAI client for a model.
+
+    All agents share one instance per model, and every model shares the same
+    HTTP connection pool; per-agent settings such as temperature are applied
+    with `.bind()`.
+    """
+    return ChatOpenAI(
+        model=model_name,
+        api_key=os.getenv("OPENAI_API_KEY"),
+        http_client=shared_http_client(),
+        http_async_client=shared_async_http_client(),
+    )
+
+
+# ==================== Inventory Helpers ====================
+
+@functools.cache
+def _load_inventory_cached(inventory_path: str) -> Dict[str, Any]:
+    """Parse an inventory file once per process; the result is shared read-only."""
+    try:
+        raw = Path(inventory_path).read_bytes()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Inventory file not found: {inventory_path}")
+    if orjson:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_date(date_str: str) -> date:
+    """Parse an ISO date/datetime string to a date (memoized; raises ValueError)."""
+    return datetime.fromisoformat(date_str).date()
+
+
+_PRICE_RE = re.compile(r"(\d[\d,]*(?:\.\d+)?)\s*(k\b|thousand|grand)?", re.IGNORECASE)
+# Smaller amounts are not car prices (e.g. "around 40" or a model year)
+MIN_PLAUSIBLE_PRICE = 1000
+
+
+def _parse_price_range(text: str) -> Tuple[float, float]:
+    """Parse '$35,000 - $42,000' (or a budget like '50k' / '40 thousand') into (min, max) dollars."""
+    prices = [
+        price
+        for amount, thousands in _PRICE_RE.findall(text or "")
+        if (price := float(amount.replace(",", "")) * (1000 if thousands else 1))
+        >= MIN_PLAUSIBLE_PRICE
+    ]
+    if not prices:
+        raise ValueError(f"No price found in {text!r}")
+    return min(prices), max(prices)
+
+
+def _reset_booking_sequence() -> None:
+    """Start a fresh booking sequence for this process under a random prefix."""
+    global _booking_prefix, _booking_counter
+    _booking_prefix = secrets.randbits(32)
+    _booking_counter = itertools.count(int(time.time()))
+
+
+_reset_booking_sequence()
+# Forked workers must not continue the parent's sequence under the parent's prefix
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_booking_sequence)
+
+
+def new_booking_id() -> str:
+    """
+    Return a unique booking ID.
+
+    IDs never repeat within a process: the counter is atomic under the GIL.
+    Each process (including every restart and forked worker) draws a random
+    32-bit prefix, so IDs from different processes only collide if two prefixes
+    match; PIDs are no help here since containers typically run as PID 1.
+    """
+    return f"TD-{_booking_prefix:08x}-{next(_booking_counter):x}"
+
 
 # ==================== Data Models ====================
 
 class TestDriveBooking(BaseModel):
     """Data model for test drive bookings."""
+    # Bookings are immutable once recorded
+    model_config = ConfigDict(frozen=True)
+
     booking_id: str
     customer_name: str
     customer_phone: str
@@ -37,45 +215,114 @@ class TestDriveBooking(BaseModel):
 class KnowledgeBase:
     """Load and manage car inventory knowledge base."""
 
+    # Upper bound on memoized search results (queries come from users and the LLM)
+    SEARCH_CACHE_SIZE = 128
+
     def __init__(self, inventory_path: str = "data/car_inventory.json"):
         self.inventory_path = inventory_path
         self.data = self._load_inventory()
         self.bookings: List[TestDriveBooking] = []
+        self._bookings_by_id: Dict[str, TestDriveBooking] = {}
+        self._booking_records: List[Dict[str, Any]] = []
+        self._build_indices()
 
     def _load_inventory(self) -> Dict[str, Any]:
         """Load car inventory from JSON file."""
-        try:
-            with open(self.inventory_path, "r") as f:
-                return json.load(f)
-        except FileNotFoundError:
-            raise FileNotFoundError(f"Inventory file not found: {self.inventory_path}")
+        return _load_inventory_cached(self.inventory_path)
+
+    def _build_indices(self) -> None:
+        """Index the inventory by id, type and brand so lookups skip full scans."""
+        self._by_id: Dict[str, Dict[str, Any]] = {}
+        self._by_type: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        self._by_brand: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        self._available: List[Dict[str, Any]] = []
+        self._search_cache: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+        # Parsed (min, max) prices kept beside the raw dicts, which stay display-only
+        self._price_bounds: Dict[str, Tuple[float, float]] = {}
+        for car in self.data.get("inventory", []):
+            self._by_id[car.get("id")] = car
+            try:
+                self._price_bounds[car.get("id")] = _parse_price_range(car.get("price_range", ""))
+            except ValueError:
+                pass
+            self._by_type[car.get("type", "").lower()].append(car)
+            self._by_brand[car.get("brand", "").lower()].append(car)
+            if car.get("availability", False):
+                self._available.append(car)
+
+    def _search(self, field: str, query: str) -> List[Dict[str, Any]]:
+        """
+        Collect cars whose type/brand contains the query (case-insensitive).
+
+        Results are memoized per query and shared between callers, so they
+        must be treated as read-only.
+        """
+        key = (field, query.lower())
+        results = self._search_cache.get(key)
+        if results is None:
+            index = self._by_type if field == "type" else self._by_brand
+            if key[1] in index:
+                results = index[key[1]]
+            else:
+                results = [car for name, cars in index.items() if key[1] in name for car in cars]
+            if len(self._search_cache) >= self.SEARCH_CACHE_SIZE:
+                self._search_cache.clear()
+            self._search_cache[key] = results
+        return results
 
     def search_cars_by_type(self, car_type: str) -> List[Dict[str, Any]]:
         """Search cars by type (e.g., 'sedan', 'SUV')."""
-        results = []
-        for car in self.data.get("inventory", []):
-            if car_type.lower() in car.get("type", "").lower():
-                results.append(car)
-        return results
+        return self._search("type", car_type)
 
     def search_cars_by_brand(self, brand: str) -> List[Dict[str, Any]]:
         """Search cars by brand."""
-        results = []
-        for car in self.data.get("inventory", []):
-            if brand.lower() in car.get("brand", "").lower():
-                results.append(car)
-        return results
+        return self._search("brand", brand)
 
     def get_car_details(self, car_id: str) -> Optional[Dict[str, Any]]:
         """Get detailed information about a specific car."""
-        for car in self.data.get("inventory", []):
-            if car.get("id") == car_id:
-                return car
-        return None
+        return self._by_id.get(car_id)
 
     def get_available_cars(self) -> List[Dict[str, Any]]:
         """Get all available cars for test drive."""
-        return [car for car in self.data.get("inventory", []) if car.get("availability", False)]
+        return self._available
+
+    def filter_cars(
+        self,
+        car_type: Optional[str] = None,
+        max_price: Optional[float] = None,
+        min_price: Optional[float] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Filter cars by type and budget in one pass.
+
+        Without a type, only available cars are considered.
+        """
+        candidates = self.search_cars_by_type(car_type) if car_type else self.get_available_cars()
+        return self.filter_by_budget(candidates, min_price, max_price)
+
+    def filter_by_budget(
+        self,
+        cars: List[Dict[str, Any]],
+        min_price: Optional[float] = None,
+        max_price: Optional[float] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Keep cars whose price range overlaps [min_price, max_price].
+
+        Either bound may be omitted; cars without a parseable price only match
+        when no budget is given.
+        """
+        if min_price is None and max_price is None:
+            return list(cars)
+        low = float("-inf") if min_price is None else min_price
+        high = float("inf") if max_price is None else max_price
+        bounds = self._price_bounds
+        return [
+            car for car in cars
+            if car.get("id") in bounds
+            and bounds[car.get("id")][0] <= high
+            and bounds[car.get("id")][1] >= low
+        ]
 
     def get_working_hours(self) -> Dict[str, str]:
         """Get dealership working hours."""
@@ -85,23 +332,30 @@ class KnowledgeBase:
         """Check if a specific date and time is available."""
         try:
             # Simple availability check - in production, would query actual calendar
-            requested_date = datetime.fromisoformat(date_str)
-            if requested_date.date() < datetime.now().date():
-                return False
-            
-            # Check if within 30 days
-            if (requested_date.date() - datetime.now().date()).days > 30:
-                return False
-            
-            return True
+            requested_date = _parse_date(date_str)
         except ValueError:
             return False
 
+        # Must be between today and 30 days out
+        days_ahead = (requested_date - date.today()).days
+        return 0 <= days_ahead <= 30
+
     def book_test_drive(self, booking: TestDriveBooking) -> bool:
         """Record a test drive booking."""
         self.bookings.append(booking)
+        self._bookings_by_id[booking.booking_id] = booking
+        # Bookings are frozen, so each one is serialized exactly once
+        self._booking_records.append(booking.model_dump())
         return True
 
+    def get_booking_records(self) -> List[Dict[str, Any]]:
+        """Get all bookings as plain dicts (shared; treat as read-only)."""
+        return self._booking_records
+
+    def get_booking(self, booking_id: str) -> Optional[TestDriveBooking]:
+        """Look up a recorded booking by its ID."""
+        return self._bookings_by_id.get(booking_id)
+
     def get_dealership_info(self) -> Dict[str, Any]:
         """Get dealership contact and general information."""
         dealership = self.data.get("dealership", {})
@@ -114,51 +368,83 @@ class KnowledgeBase:
 
 # ==================== Agent Tools ====================
 
+def _format_car_list(header: str, cars: List[Dict[str, Any]], separator: str) -> str:
+    """Render a header line followed by one '- Brand Model (year)<separator>$price' line per car."""
+    return header + "".join([
+        f"- {car['brand']} {car['model']} ({car['year']}){separator}${car['price_range']}\n"
+        for car in cars
+    ])
+
+
 class DealershipTools:
     """Tools for agents to interact with dealership data."""
 
+    # Upper bound on memoized tool outputs; tool arguments come from the LLM
+    # so the key space is open-ended.
+    OUTPUT_CACHE_SIZE = 256
+
     def __init__(self, knowledge_base: KnowledgeBase):
         self.kb = knowledge_base
+        self._output_cache: Dict[Tuple[str, ...], str] = {}
+        self._tools = self._build_tools()
+
+    def _cached(self, key: Tuple[str, ...], build: Callable[[], str]) -> str:
+        """
+        Return a memoized read-only tool output, formatting it on first use.
+
+        Only inventory lookups are cached; the inventory is loaded once and never
+        modified (bookings are stored separately), so entries cannot go stale.
+        """
+        output = self._output_cache.get(key)
+        if output is None:
+            if len(self._output_cache) >= self.OUTPUT_CACHE_SIZE:
+                self._output_cache.clear()
+            output = self._output_cache[key] = build()
+        return output
 
     @tool
     def search_car_by_type(self, car_type: str) -> str:
         """Search for cars by type (sedan, SUV, truck, compact, electric)."""
+        return self._cached(("search_car_by_type", car_type), lambda: self._format_search(car_type))
+
+    def _format_search(self, car_type: str) -> str:
         results = self.kb.search_cars_by_type(car_type)
         if not results:
             return f"No cars found of type '{car_type}'"
         
-        response = f"Found {len(results)} car(s) of type '{car_type}':\n"
-        for car in results:
-            response += f"- {car['brand']} {car['model']} ({car['year']}): ${car['price_range']}\n"
-        return response
+        return _format_car_list(f"Found {len(results)} car(s) of type '{car_type}':\n", results, ": ")
 
     @tool
     def get_car_details(self, car_id: str) -> str:
         """Get detailed information about a specific car."""
+        return self._cached(("get_car_details", car_id), lambda: self._format_details(car_id))
+
+    def _format_details(self, car_id: str) -> str:
         car = self.kb.get_car_details(car_id)
         if not car:
             return f"Car with ID '{car_id}' not found"
         
-        response = f"**{car['brand']} {car['model']} {car['year']}**\n"
-        response += f"Type: {car['type']}\n"
-        response += f"Price: {car['price_range']}\n"
-        response += f"Features: {', '.join(car['features'][:5])}\n"
-        response += f"Fuel Type: {car.get('fuel_type', 'N/A')}\n"
-        response += f"MPG: {car.get('mpg', 'N/A')}\n"
-        response += f"Seating: {car.get('seating_capacity', 'N/A')}\n"
-        return response
+        return (
+            f"**{car['brand']} {car['model']} {car['year']}**\n"
+            f"Type: {car['type']}\n"
+            f"Price: {car['price_range']}\n"
+            f"Features: {', '.join(car['features'][:5])}\n"
+            f"Fuel Type: {car.get('fuel_type', 'N/A')}\n"
+            f"MPG: {car.get('mpg', 'N/A')}\n"
+            f"Seating: {car.get('seating_capacity', 'N/A')}\n"
+        )
 
     @tool
     def list_available_cars(self) -> str:
         """List all available cars for test drive."""
+        return self._cached(("list_available_cars",), self._format_available)
+
+    def _format_available(self) -> str:
         cars = self.kb.get_available_cars()
         if not cars:
             return "No cars are currently available"
         
-        response = "Available cars for test drive:\n"
-        for car in cars:
-            response += f"- {car['brand']} {car['model']} ({car['year']}) - ${car['price_range']}\n"
-        return response
+        return _format_car_list("Available cars for test drive:\n", cars, " - ")
 
     @tool
     def check_availability(self, date: str, time: str) -> str:
@@ -171,15 +457,22 @@ class DealershipTools:
     @tool
     def get_dealership_info(self) -> str:
         """Get dealership contact information and working hours."""
+        return self._cached(("get_dealership_info",), self._format_dealership_info)
+
+    def _format_dealership_info(self) -> str:
         info = self.kb.get_dealership_info()
-        response = f"**{info['name']}**\n"
-        response += f"Location: {info.get('location', 'N/A')}\n"
-        response += f"Contact: {info.get('contact', 'N/A')}\n"
-        response += f"Email: {info.get('email', 'N/A')}\n\n"
-        response += "Working Hours:\n"
-        for day, hours in info.get('working_hours', {}).items():
-            response += f"- {day.capitalize()}: {hours}\n"
-        return response
+        lines = [
+            f"**{info['name']}**\n",
+            f"Location: {info.get('location', 'N/A')}\n",
+            f"Contact: {info.get('contact', 'N/A')}\n",
+            f"Email: {info.get('email', 'N/A')}\n\n",
+            "Working Hours:\n",
+        ]
+        lines.extend(
+            f"- {day.capitalize()}: {hours}\n"
+            for day, hours in info.get('working_hours', {}).items()
+        )
+        return "".join(lines)
 
     @tool
     def book_test_drive(self, customer_name: str, customer_phone: str, car_id: str, 
@@ -193,7 +486,7 @@ class DealershipTools:
             return f"Cannot book: {preferred_date} at {preferred_time} is not available"
 
         booking = TestDriveBooking(
-            booking_id=f"TD-{int(datetime.now().timestamp())}",
+            booking_id=new_booking_id(),
             customer_name=customer_name,
             customer_phone=customer_phone,
             car_model=f"{car['brand']} {car['model']}",
@@ -217,6 +510,10 @@ class DealershipTools:
 
     def get_tools(self) -> List[LangchainTool]:
         """Get all tools as LangChain Tool objects."""
+        return self._tools
+
+    def _build_tools(self) -> List[LangchainTool]:
+        """Wrap the tool methods as LangChain Tool objects (done once per instance)."""
         return [
             LangchainTool(
                 name="search_car_by_type",
@@ -256,14 +553,18 @@ class DealershipTools:
 class ConversationAgent:
     """Agent responsible for understanding customer intent and managing dialogue."""
 
-    def __init__(self, tools: List[LangchainTool], model_name: str = "gpt-4"):
-        self.llm = ChatOpenAI(
-            model=model_name,
-            temperature=0.7,
-            api_key=os.getenv("OPENAI_API_KEY"),
-        )
+    def __init__(
+        self,
+        tools: List[LangchainTool],
+        model_name: str = "gpt-4",
+        llm: Optional[ChatOpenAI] = None,
+        memory_window: int = 6,
+    ):
+        self.llm = (llm or make_llm(model_name)).bind(temperature=0.7)
         self.tools = tools
-        self.memory = ConversationBufferMemory(
+        # Only the last `memory_window` exchanges are replayed, keeping prompt size constant
+        self.memory = ConversationBufferWindowMemory(
+            k=memory_window,
             memory_key="chat_history",
             return_messages=True,
         )
@@ -315,37 +616,54 @@ Always be polite, helpful, and try to understand the customer's needs. Use the a
         except Exception as e:
             return f"Sorry, I encountered an error: {str(e)}"
 
+    async def aprocess_input(self, user_input: str) -> str:
+        """Async version of process_input; awaits the LLM without blocking the event loop."""
+        try:
+            response = await self.agent_executor.ainvoke({"input": user_input})
+            return response.get("output", "I didn't understand that. Can you please rephrase?")
+        except Exception as e:
+            return f"Sorry, I encountered an error: {str(e)}"
+
 
 class KnowledgeAgent:
     """Specialized agent for querying car information."""
 
-    def __init__(self, knowledge_base: KnowledgeBase):
+    def __init__(self, knowledge_base: KnowledgeBase, model_name: str = "gpt-4o-mini"):
         self.kb = knowledge_base
-        self.llm = ChatOpenAI(
-            model="gpt-4",
-            temperature=0.5,
-            api_key=os.getenv("OPENAI_API_KEY"),
-        )
+        self.model_name = model_name
+
+    @functools.cached_property
+    def llm(self):
+        """Shared LLM client, only created if a method actually needs it."""
+        return make_llm(self.model_name).bind(temperature=0.5)
 
     def get_car_recommendations(self, preferences: Dict[str, str]) -> List[Dict[str, Any]]:
         """Recommend cars based on customer preferences."""
         car_type = preferences.get("type", "").lower()
         budget = preferences.get("budget", "")
-        
-        results = self.kb.search_cars_by_type(car_type) if car_type else self.kb.get_available_cars()
+
+        max_price = None
+        if budget:
+            try:
+                _, max_price = _parse_price_range(budget)
+            except ValueError:
+                pass
+
+        results = self.kb.filter_cars(car_type=car_type or None, max_price=max_price)
         return results[:3]  # Return top 3 recommendations
 
 
 class BookingAgent:
     """Specialized agent for managing test drive bookings."""
 
-    def __init__(self, knowledge_base: KnowledgeBase):
+    def __init__(self, knowledge_base: KnowledgeBase, model_name: str = "gpt-4o-mini"):
         self.kb = knowledge_base
-        self.llm = ChatOpenAI(
-            model="gpt-4",
-            temperature=0.3,
-            api_key=os.getenv("OPENAI_API_KEY"),
-        )
+        self.model_name = model_name
+
+    @functools.cached_property
+    def llm(self):
+        """Shared LLM client, only created if a method actually needs it."""
+        return make_llm(self.model_name).bind(temperature=0.3)
 
     def confirm_booking(self, booking_details: Dict[str, str]) -> bool:
         """Confirm and finalize a booking."""
@@ -354,7 +672,7 @@ class BookingAgent:
             return False
         
         booking = TestDriveBooking(
-            booking_id=f"TD-{int(datetime.now().timestamp())}",
+            booking_id=new_booking_id(),
             customer_name=booking_details["customer_name"],
             customer_phone=booking_details["customer_phone"],
             car_model=booking_details.get("car_model", ""),
@@ -368,7 +686,5 @@ class BookingAgent:
 
     def get_booking_confirmation(self, booking_id: str) -> Optional[Dict[str, Any]]:
         """Retrieve booking confirmation details."""
-        for booking in self.kb.bookings:
-            if booking.booking_id == booking_id:
-                return booking.dict()
-        return None
+        booking = self.kb.get_booking(booking_id)
+        return booking.model_dump() if booking else None
@@ -4,18 +4,26 @@ Provides REST API endpoints for web and mobile clients.
 """
 
 import os
+import time
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 import asyncio
 
+import orjson
 from fastapi import FastAPI, HTTPException, UploadFile, File, WebSocket
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, ORJSONResponse, Response, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ValidationError
 from dotenv import load_dotenv
 
 from src.orchestrator import DealershipAssistant
-from src.agents import TestDriveBooking
+from src.agents import TestDriveBooking, close_http_clients, new_booking_id
+from src.voice_utils import (
+    AudioTooLarge,
+    clear_provider_cache,
+    remove_audio_file,
+    save_audio_upload,
+)
 
 # Load environment variables
 load_dotenv()
@@ -25,6 +33,7 @@ app = FastAPI(
     title="Auto Dealership Voice Assistant API",
     description="Multi-agent voice assistant for test drive booking",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
 )
 
 # Add CORS middleware
@@ -36,13 +45,76 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Initialize assistant
-assistant = DealershipAssistant(
-    use_voice=True,
-    voice_provider=os.getenv("VOICE_PROVIDER", "local"),
-    inventory_path=os.getenv("INVENTORY_PATH", "data/car_inventory.json"),
-    model_name=os.getenv("MODEL_NAME", "gpt-4"),
-)
+# Assistant is built per worker on startup, so importing this module stays cheap
+assistant: Optional[DealershipAssistant] = None
+
+# Static responses serialized once (dealership info is filled in on startup)
+_ROOT_JSON = orjson.dumps({
+    "status": "online",
+    "service": "Auto Dealership Voice Assistant",
+    "version": "1.0.0",
+})
+_dealership_info_json: bytes = b""
+# Validated CarDetails payloads by car ID, built once at startup
+_public_cars: Dict[str, Dict[str, Any]] = {}
+
+
+def get_assistant() -> DealershipAssistant:
+    """Return the worker's assistant, created by the startup hook."""
+    if assistant is None:
+        raise RuntimeError("Assistant is not initialized; the app has not started up")
+    return assistant
+
+
+@app.on_event("startup")
+async def init_assistant():
+    """Build the assistant, check the inventory, and warm up models."""
+    global assistant, _dealership_info_json, _public_cars
+    assistant = await asyncio.to_thread(
+        DealershipAssistant,
+        use_voice=True,
+        voice_provider=os.getenv("VOICE_PROVIDER", "local"),
+        inventory_path=os.getenv("INVENTORY_PATH", "data/car_inventory.json"),
+        model_name=os.getenv("MODEL_NAME", "gpt-4"),
+    )
+
+    # Validate the inventory against CarDetails once; the list endpoints serve
+    # these dumps, so coerced values match the schema and need no re-validation
+    _public_cars = {}
+    for car in assistant.knowledge_base.data.get("inventory", []):
+        try:
+            _public_cars[car.get("id")] = CarDetails.model_validate(car).model_dump()
+        except ValidationError as e:
+            print(f"⚠ Warning: Skipping invalid inventory entry {car.get('id')!r}: {e}")
+    _dealership_info_json = DealershipInfo(
+        **assistant.knowledge_base.get_dealership_info()
+    ).model_dump_json().encode()
+
+    try:
+        await asyncio.to_thread(assistant.warmup)
+    except Exception as e:
+        print(f"⚠ Warning: Warmup failed: {e}")
+
+
+@app.on_event("shutdown")
+async def close_connections():
+    """Close the shared outbound HTTP connection pools."""
+    await close_http_clients()
+    # Voice providers hold the now-closed clients; rebuild them on next startup
+    clear_provider_cache()
+
+
+# Formatted timestamp, rebuilt at most once per second
+_timestamp_cache = (0, "")
+
+
+def iso_timestamp() -> str:
+    """Current local time in ISO-8601 format, at one-second resolution."""
+    global _timestamp_cache
+    now = int(time.time())
+    if now != _timestamp_cache[0]:
+        _timestamp_cache = (now, datetime.fromtimestamp(now).isoformat())
+    return _timestamp_cache[1]
 
 
 # ==================== Request/Response Models ====================
@@ -57,7 +129,7 @@ class ChatResponse(BaseModel):
     """Response model for text-based chat."""
     response: str = Field(..., description="Assistant response")
     session_id: Optional[str] = Field(None, description="Session ID")
-    timestamp: str = Field(default_factory=lambda: datetime.now().isoformat())
+    timestamp: str = Field(default_factory=iso_timestamp)
 
 
 class AudioTranscriptionRequest(BaseModel):
@@ -98,6 +170,11 @@ class CarDetails(BaseModel):
     availability: bool
 
 
+def public_cars(cars: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Map inventory entries to their validated CarDetails payloads, dropping invalid ones."""
+    return [_public_cars[car["id"]] for car in cars if car.get("id") in _public_cars]
+
+
 class TestDriveBookingRequest(BaseModel):
     """Request model for booking test drive."""
     customer_name: str = Field(..., description="Customer name")
@@ -133,11 +210,7 @@ class DealershipInfo(BaseModel):
 @app.get("/", tags=["Health"])
 async def root():
     """Root endpoint - check API status."""
-    return {
-        "status": "online",
-        "service": "Auto Dealership Voice Assistant",
-        "version": "1.0.0"
-    }
+    return Response(_ROOT_JSON, media_type="application/json")
 
 
 @app.get("/health", tags=["Health"])
@@ -145,7 +218,7 @@ async def health_check():
     """Health check endpoint."""
     return {
         "status": "healthy",
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": iso_timestamp(),
     }
 
 
@@ -163,7 +236,7 @@ async def chat(request: ChatRequest) -> ChatResponse:
         Chat response from the assistant
     """
     try:
-        response = await assistant.process_text_async(request.message)
+        response = await get_assistant().process_text_async(request.message)
         return ChatResponse(
             response=response,
             session_id=request.session_id,
@@ -174,6 +247,10 @@ async def chat(request: ChatRequest) -> ChatResponse:
 
 # ==================== Voice Endpoints ====================
 
+# Matches OpenAI's Whisper upload limit; staged in RAM-backed /dev/shm when available
+MAX_AUDIO_UPLOAD_BYTES = int(os.getenv("MAX_AUDIO_UPLOAD_MB", "25")) * 1024 * 1024
+
+
 @app.post("/api/v1/transcribe", response_model=AudioTranscriptionResponse, tags=["Voice"])
 async def transcribe_audio(file: UploadFile = File(...)):
     """
@@ -185,28 +262,28 @@ async def transcribe_audio(file: UploadFile = File(...)):
     Returns:
         Transcribed text
     """
+    path = None
     try:
-        if not assistant.stt:
+        if not get_assistant().stt:
             raise HTTPException(status_code=400, detail="Speech-to-text not available")
 
-        # Save uploaded file
-        contents = await file.read()
-        with open("temp_audio.wav", "wb") as f:
-            f.write(contents)
+        # Stream the upload to a per-request file in chunks, off the event loop
+        path = await asyncio.to_thread(save_audio_upload, file.file, MAX_AUDIO_UPLOAD_BYTES)
 
         # Transcribe
-        text = await assistant.stt.listen_async()
+        text = await get_assistant().stt.listen_async(path=path)
         if not text:
             raise HTTPException(status_code=400, detail="Could not transcribe audio")
 
         return AudioTranscriptionResponse(text=text)
     except HTTPException:
         raise
+    except AudioTooLarge as e:
+        raise HTTPException(status_code=413, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error transcribing audio: {str(e)}")
     finally:
-        if os.path.exists("temp_audio.wav"):
-            os.remove("temp_audio.wav")
+        remove_audio_file(path)
 
 
 @app.post("/api/v1/speak", tags=["Voice"])
@@ -218,21 +295,49 @@ async def text_to_speech(request: TextToSpeechRequest):
         request: Text-to-speech request
 
     Returns:
-        Audio file
+        Audio stream, sent as it is synthesized
+    """
+    tts = get_assistant().tts
+    if not tts:
+        raise HTTPException(status_code=400, detail="Text-to-speech not available")
+
+    return StreamingResponse(
+        tts.synthesize_stream(request.text),
+        media_type=tts.audio_media_type,
+    )
+
+
+@app.post("/api/v1/speak/local", tags=["Voice"])
+async def text_to_speech_local(request: TextToSpeechRequest):
+    """
+    Play text as speech on the server (debugging aid).
+
+    Args:
+        request: Text-to-speech request
+
+    Returns:
+        Status message
     """
     try:
-        if not assistant.tts:
+        if not get_assistant().tts:
             raise HTTPException(status_code=400, detail="Text-to-speech not available")
 
-        await assistant.speak(request.text)
+        await get_assistant().speak(request.text)
         return {"status": "success", "message": "Audio generated"}
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error generating speech: {str(e)}")
 
 
 # ==================== Car Endpoints ====================
 
-@app.get("/api/v1/cars", response_model=List[CarDetails], tags=["Cars"])
+@app.get(
+    "/api/v1/cars",
+    response_model=None,
+    responses={200: {"model": List[CarDetails]}},
+    tags=["Cars"],
+)
 async def list_cars(car_type: Optional[str] = None):
     """
     List available cars, optionally filtered by type.
@@ -245,11 +350,11 @@ async def list_cars(car_type: Optional[str] = None):
     """
     try:
         if car_type:
-            cars = assistant.knowledge_base.search_cars_by_type(car_type)
+            cars = get_assistant().knowledge_base.search_cars_by_type(car_type)
         else:
-            cars = assistant.knowledge_base.get_available_cars()
+            cars = get_assistant().knowledge_base.get_available_cars()
 
-        return [CarDetails(**car) for car in cars]
+        return public_cars(cars)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error listing cars: {str(e)}")
 
@@ -266,7 +371,7 @@ async def get_car(car_id: str):
         Detailed car information
     """
     try:
-        car = assistant.knowledge_base.get_car_details(car_id)
+        car = get_assistant().knowledge_base.get_car_details(car_id)
         if not car:
             raise HTTPException(status_code=404, detail="Car not found")
         return car
@@ -276,7 +381,12 @@ async def get_car(car_id: str):
         raise HTTPException(status_code=500, detail=f"Error retrieving car: {str(e)}")
 
 
-@app.post("/api/v1/cars/search", response_model=List[CarDetails], tags=["Cars"])
+@app.post(
+    "/api/v1/cars/search",
+    response_model=None,
+    responses={200: {"model": List[CarDetails]}},
+    tags=["Cars"],
+)
 async def search_cars(request: CarSearchRequest):
     """
     Search for cars based on criteria.
@@ -291,21 +401,18 @@ async def search_cars(request: CarSearchRequest):
         results = []
 
         if request.car_type:
-            results = assistant.knowledge_base.search_cars_by_type(request.car_type)
+            results = get_assistant().knowledge_base.search_cars_by_type(request.car_type)
         elif request.brand:
-            results = assistant.knowledge_base.search_cars_by_brand(request.brand)
+            results = get_assistant().knowledge_base.search_cars_by_brand(request.brand)
         else:
-            results = assistant.knowledge_base.get_available_cars()
+            results = get_assistant().knowledge_base.get_available_cars()
 
-        # Filter by budget if provided
-        if request.budget_min or request.budget_max:
-            # Note: In production, would parse price_range properly
-            filtered = []
-            for car in results:
-                filtered.append(car)
-            results = filtered
+        # Filter by budget against the pre-parsed price ranges
+        results = get_assistant().knowledge_base.filter_by_budget(
+            results, request.budget_min, request.budget_max
+        )
 
-        return [CarDetails(**car) for car in results]
+        return public_cars(results)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error searching cars: {str(e)}")
 
@@ -325,19 +432,19 @@ async def create_booking(request: TestDriveBookingRequest):
     """
     try:
         # Validate car exists
-        car = assistant.knowledge_base.get_car_details(request.car_id)
+        car = get_assistant().knowledge_base.get_car_details(request.car_id)
         if not car:
             raise HTTPException(status_code=404, detail="Car not found")
 
         # Check availability
-        if not assistant.knowledge_base.check_time_availability(
+        if not get_assistant().knowledge_base.check_time_availability(
             request.preferred_date, request.preferred_time
         ):
             raise HTTPException(status_code=400, detail="Requested time is not available")
 
         # Create booking
         booking = TestDriveBooking(
-            booking_id=f"TD-{int(datetime.now().timestamp())}",
+            booking_id=new_booking_id(),
             customer_name=request.customer_name,
             customer_phone=request.customer_phone,
             customer_email=request.customer_email,
@@ -348,7 +455,7 @@ async def create_booking(request: TestDriveBookingRequest):
             test_drive_duration=car.get("test_drive_duration_minutes", 60),
         )
 
-        if not assistant.knowledge_base.book_test_drive(booking):
+        if not get_assistant().knowledge_base.book_test_drive(booking):
             raise HTTPException(status_code=400, detail="Failed to create booking")
 
         return TestDriveBookingResponse(
@@ -375,7 +482,7 @@ async def list_bookings():
         List of bookings
     """
     try:
-        bookings = [b.dict() for b in assistant.get_bookings()]
+        bookings = get_assistant().get_booking_records()
         return {"bookings": bookings, "count": len(bookings)}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error retrieving bookings: {str(e)}")
@@ -393,10 +500,10 @@ async def get_booking(booking_id: str):
         Booking details
     """
     try:
-        for booking in assistant.get_bookings():
-            if booking.booking_id == booking_id:
-                return booking.dict()
-        raise HTTPException(status_code=404, detail="Booking not found")
+        booking = get_assistant().get_booking(booking_id)
+        if not booking:
+            raise HTTPException(status_code=404, detail="Booking not found")
+        return booking.model_dump()
     except HTTPException:
         raise
     except Exception as e:
@@ -405,19 +512,22 @@ async def get_booking(booking_id: str):
 
 # ==================== Dealership Info Endpoints ====================
 
-@app.get("/api/v1/dealership", response_model=DealershipInfo, tags=["Info"])
+@app.get(
+    "/api/v1/dealership",
+    response_model=None,
+    responses={200: {"model": DealershipInfo}},
+    tags=["Info"],
+)
 async def get_dealership_info():
     """
     Get dealership information and working hours.
 
     Returns:
-        Dealership details
+        Dealership details, pre-serialized on startup
     """
-    try:
-        info = assistant.knowledge_base.get_dealership_info()
-        return DealershipInfo(**info)
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error retrieving dealership info: {str(e)}")
+    if not _dealership_info_json:
+        raise HTTPException(status_code=503, detail="Dealership info not loaded yet")
+    return Response(_dealership_info_json, media_type="application/json")
 
 
 # ==================== WebSocket Endpoints ====================
@@ -434,21 +544,30 @@ async def websocket_chat(websocket: WebSocket, client_id: str):
     await websocket.accept()
     try:
         while True:
-            data = await websocket.receive_json()
+            # Decode binary or text frames with orjson; reply in the same frame type
+            frame = await websocket.receive()
+            if frame["type"] == "websocket.disconnect":
+                break
+            binary = frame.get("bytes") is not None
+            data = orjson.loads(frame["bytes"] if binary else frame.get("text") or "{}")
             message = data.get("message", "")
 
             if not message:
                 continue
 
             # Process message
-            response = await assistant.process_text_async(message)
+            response = await get_assistant().process_text_async(message)
 
             # Send response
-            await websocket.send_json({
+            payload = orjson.dumps({
                 "response": response,
                 "client_id": client_id,
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": iso_timestamp(),
             })
+            if binary:
+                await websocket.send_bytes(payload)
+            else:
+                await websocket.send_text(payload.decode())
     except Exception as e:
         await websocket.close(code=1011, reason=f"Error: {str(e)}")
 
@@ -459,10 +578,15 @@ if __name__ == "__main__":
     port = int(os.getenv("API_PORT", 8000))
     host = os.getenv("API_HOST", "0.0.0.0")
     debug = os.getenv("API_DEBUG", "true").lower() == "true"
+    # Each worker builds its own assistant (inventory, caches, bookings), so
+    # bookings are per-process until they move to shared storage
+    workers = int(os.getenv("WEB_CONCURRENCY", "1"))
 
+    # uvicorn's default loop/http ("auto") pick uvloop and httptools when installed
     uvicorn.run(
         "src.api:app",
         host=host,
         port=port,
-        reload=debug,
+        reload=debug and workers == 1,
+        workers=workers,
     )
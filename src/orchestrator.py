@@ -4,6 +4,7 @@ Coordinates between Conversation, Knowledge, and Booking agents.
 """
 
 import os
+import re
 from typing import Optional, Dict, Any
 import asyncio
 from dotenv import load_dotenv
@@ -14,10 +15,18 @@ from src.agents import (
     BookingAgent,
     DealershipTools,
     KnowledgeBase,
+    TestDriveBooking,
+    configure_llm_cache,
+    make_llm,
+    shared_async_http_client,
+    shared_http_client,
 )
 from src.voice_utils import (
     get_stt_provider,
     get_tts_provider,
+    CachingSTT,
+    CachingTTS,
+    ParallelTTS,
     SpeechToText,
     TextToSpeech,
 )
@@ -25,6 +34,14 @@ from src.voice_utils import (
 # Load environment variables
 load_dotenv()
 
+EXIT_WORDS = frozenset(("bye", "goodbye", "exit", "quit"))
+EXIT_RE = re.compile(r"\b(?:%s)\b" % "|".join(sorted(EXIT_WORDS)), re.IGNORECASE)
+
+
+def is_exit_command(text: str) -> bool:
+    """Check whether an utterance contains an exit word (whole words only)."""
+    return EXIT_RE.search(text) is not None
+
 
 class DealershipAssistant:
     """Main orchestrator for the auto dealership voice assistant."""
@@ -35,19 +52,28 @@ class DealershipAssistant:
         voice_provider: str = "local",
         inventory_path: str = "data/car_inventory.json",
         model_name: str = "gpt-4",
+        helper_model_name: str = "gpt-4o-mini",
     ):
         """
         Initialize the dealership assistant.
 
         Args:
             use_voice: Enable voice interaction
-            voice_provider: Voice provider to use ('openai', 'azure', 'google', 'local')
+            voice_provider: Voice provider to use ('openai', 'azure', 'google', 'local', 'faster-whisper')
             inventory_path: Path to car inventory JSON file
             model_name: LLM model name to use
+            helper_model_name: Smaller LLM for the Knowledge and Booking agents
         """
         self.use_voice = use_voice
         self.voice_provider = voice_provider
         self.model_name = model_name
+        self.helper_model_name = helper_model_name
+
+        # Share cached LLM responses across agents (needs .env loaded first)
+        configure_llm_cache()
+
+        # Cap concurrent LLM turns so a burst of chats cannot flood the provider
+        self._llm_slots = asyncio.Semaphore(int(os.getenv("LLM_POOL_SIZE", "8")))
         
         # Initialize knowledge base
         self.knowledge_base = KnowledgeBase(inventory_path)
@@ -55,10 +81,11 @@ class DealershipAssistant:
         # Initialize tools
         self.tools = DealershipTools(self.knowledge_base).get_tools()
         
-        # Initialize agents
-        self.conversation_agent = ConversationAgent(self.tools, model_name)
-        self.knowledge_agent = KnowledgeAgent(self.knowledge_base)
-        self.booking_agent = BookingAgent(self.knowledge_base)
+        # Initialize agents on shared LLM clients
+        self.llm = make_llm(model_name)
+        self.conversation_agent = ConversationAgent(self.tools, model_name, llm=self.llm)
+        self.knowledge_agent = KnowledgeAgent(self.knowledge_base, helper_model_name)
+        self.booking_agent = BookingAgent(self.knowledge_base, helper_model_name)
         
         # Initialize voice components if enabled
         self.stt: Optional[SpeechToText] = None
@@ -66,13 +93,41 @@ class DealershipAssistant:
         
         if self.use_voice:
             try:
-                self.stt = get_stt_provider(provider=voice_provider)
-                self.tts = get_tts_provider(provider=voice_provider)
+                # Voice providers reuse the LLM's connection pools
+                http_clients = {
+                    "http_client": shared_http_client(),
+                    "async_http_client": shared_async_http_client(),
+                }
+                self.stt = get_stt_provider(provider=voice_provider, **http_clients)
+                self.tts = get_tts_provider(provider=voice_provider, **http_clients)
+
+                # Reuse results for repeated prompts and identical uploads
+                cache_ttl = float(os.getenv("VOICE_CACHE_TTL", "3600"))
+                if cache_ttl > 0:
+                    cache_size = int(os.getenv("VOICE_CACHE_SIZE", "512"))
+                    self.stt = CachingSTT(self.stt, cache_size, cache_ttl)
+                    self.tts = CachingTTS(self.tts, cache_size, cache_ttl)
+
+                # Split replies into sentences outside the cache, so each
+                # sentence is cached and repeated ones are not re-synthesized
+                self.tts = ParallelTTS(self.tts, int(os.getenv("TTS_CONCURRENCY", "3")))
                 print("✓ Voice components initialized successfully")
             except Exception as e:
                 print(f"⚠ Warning: Could not initialize voice components: {e}")
                 self.use_voice = False
 
+    def warmup(self) -> None:
+        """
+        Load voice models and the LLM tokenizer before the first request.
+
+        Does not call the LLM, so nothing is billed or added to conversation memory.
+        """
+        if self.stt:
+            self.stt.warmup()
+        if self.tts:
+            self.tts.warmup()
+        self.llm.get_num_tokens("warmup")
+
     def process_text(self, user_input: str) -> str:
         """
         Process text input and return response from conversation agent.
@@ -87,7 +142,8 @@ class DealershipAssistant:
 
     async def process_text_async(self, user_input: str) -> str:
         """Async version of process_text."""
-        return await asyncio.to_thread(self.process_text, user_input)
+        async with self._llm_slots:
+            return await self.conversation_agent.aprocess_input(user_input)
 
     async def listen(self) -> Optional[str]:
         """
@@ -143,7 +199,7 @@ class DealershipAssistant:
             print(f"\n[Customer]: {user_input}")
 
             # Check for exit commands
-            if any(word in user_input.lower() for word in ["bye", "goodbye", "exit", "quit"]):
+            if is_exit_command(user_input):
                 farewell = (
                     "Thank you for visiting Premium Auto Dealership! "
                     "We look forward to seeing you soon. Goodbye!"
@@ -180,7 +236,7 @@ class DealershipAssistant:
                     continue
 
                 # Check for exit commands
-                if user_input.lower() in ["bye", "goodbye", "exit", "quit"]:
+                if is_exit_command(user_input):
                     farewell = (
                         "Thank you for visiting Premium Auto Dealership! "
                         "We look forward to seeing you soon. Goodbye!"
@@ -202,6 +258,14 @@ class DealershipAssistant:
         """Get all bookings made during this session."""
         return self.knowledge_base.bookings
 
+    def get_booking_records(self) -> list:
+        """Get all bookings made during this session as serialized dicts."""
+        return self.knowledge_base.get_booking_records()
+
+    def get_booking(self, booking_id: str) -> Optional[TestDriveBooking]:
+        """Get a booking made during this session by its ID."""
+        return self.knowledge_base.get_booking(booking_id)
+
     def display_bookings(self) -> None:
         """Display all bookings made during this session."""
         bookings = self.get_bookings()
@@ -237,7 +301,7 @@ def main():
     parser.add_argument(
         "--voice-provider",
         default="local",
-        choices=["openai", "azure", "google", "local"],
+        choices=["openai", "azure", "google", "local", "faster-whisper"],
         help="Voice provider to use",
     )
     parser.add_argument(
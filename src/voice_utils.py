@@ -1,17 +1,31 @@
 """
 Voice utilities for Speech-to-Text and Text-to-Speech operations.
-Supports multiple providers: OpenAI, Azure, Google Cloud, and local (pyttsx3).
+Supports multiple providers: OpenAI, Azure, Google Cloud, local (pyttsx3),
+and on-device Whisper (faster-whisper).
 """
 
+import atexit
+import errno
+import functools
+import hashlib
+import io
 import os
-from abc import ABC, abstractmethod
-from typing import Optional
+import queue
+import re
+import tempfile
+import threading
+import time
+import wave
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, AsyncIterator, BinaryIO, Callable, Dict, List, Optional, Protocol
 import asyncio
 from enum import Enum
 
 try:
-    from openai import OpenAI
+    from openai import AsyncOpenAI, OpenAI
 except ImportError:
+    AsyncOpenAI = None
     OpenAI = None
 
 try:
@@ -30,6 +44,26 @@ try:
 except ImportError:
     pyttsx3 = None
 
+try:
+    from faster_whisper import WhisperModel
+except ImportError:
+    WhisperModel = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import pyaudio
+except ImportError:
+    pyaudio = None
+
+try:
+    import webrtcvad
+except ImportError:
+    webrtcvad = None
+
 import speech_recognition as sr
 
 
@@ -39,59 +73,487 @@ class VoiceProvider(str, Enum):
     AZURE = "azure"
     GOOGLE = "google"
     LOCAL = "local"
+    FASTER_WHISPER = "faster-whisper"
+
 
+class TextToSpeech(Protocol):
+    """Interface for TTS implementations (subclass to inherit the defaults)."""
 
-class TextToSpeech(ABC):
-    """Abstract base class for TTS implementations."""
+    # MIME type of the bytes produced by synthesize_stream
+    audio_media_type: str = "audio/wav"
 
-    @abstractmethod
     def speak(self, text: str) -> None:
         """Convert text to speech and play it."""
-        pass
+        ...
 
-    @abstractmethod
     async def speak_async(self, text: str) -> None:
         """Async version of speak."""
-        pass
+        ...
 
+    def synthesize_stream(self, text: str) -> AsyncIterator[bytes]:
+        """Yield encoded audio for text as it is synthesized, without playing it."""
+        ...
 
-class SpeechToText(ABC):
-    """Abstract base class for STT implementations."""
+    def synthesize(self, text: str) -> bytes:
+        """Render text to WAV bytes for play(), without playing it."""
+        ...
 
-    @abstractmethod
-    def listen(self) -> Optional[str]:
-        """Listen to audio and convert to text."""
+    def play(self, audio: bytes) -> None:
+        """Play WAV bytes from synthesize() on the default output device."""
+        _play_wav(audio)
+
+    def warmup(self) -> None:
+        """Load models ahead of the first request; a no-op for remote providers."""
         pass
 
-    @abstractmethod
-    async def listen_async(self) -> Optional[str]:
+
+class SpeechToText(Protocol):
+    """Interface for STT implementations (subclass to inherit the defaults)."""
+
+    def listen(self, path: Optional[str] = None) -> Optional[str]:
+        """Transcribe the audio file at `path`, or listen on the microphone if omitted."""
+        ...
+
+    async def listen_async(self, path: Optional[str] = None) -> Optional[str]:
         """Async version of listen."""
+        ...
+
+    def warmup(self) -> None:
+        """Load models ahead of the first request; a no-op for remote providers."""
         pass
 
 
+# Voice activity gate: skip transcribing clips with too little speech
+VAD_SAMPLE_RATE = 16000
+VAD_FRAME_MS = 30
+VAD_MIN_SPEECH_MS = 300
+VAD_MIN_SPEECH_RATIO = 0.2
+
+
+def _has_speech(audio: "sr.AudioData", aggressiveness: int = 2) -> bool:
+    """Check a captured clip for enough voiced frames (always True without webrtcvad)."""
+    if not webrtcvad:
+        return True
+    pcm = audio.get_raw_data(convert_rate=VAD_SAMPLE_RATE, convert_width=2)
+    frame_bytes = VAD_SAMPLE_RATE * VAD_FRAME_MS // 1000 * 2
+    frames = [
+        pcm[i:i + frame_bytes]
+        for i in range(0, len(pcm) - frame_bytes + 1, frame_bytes)
+    ]
+    if not frames:
+        return False
+    vad = webrtcvad.Vad(aggressiveness)
+    voiced = sum(vad.is_speech(frame, VAD_SAMPLE_RATE) for frame in frames)
+    return (
+        voiced * VAD_FRAME_MS >= VAD_MIN_SPEECH_MS
+        and voiced / len(frames) >= VAD_MIN_SPEECH_RATIO
+    )
+
+
+def _wav_upload(audio: "sr.AudioData") -> io.BytesIO:
+    """Wrap captured audio as an in-memory WAV; the name tells the API its format."""
+    buf = io.BytesIO(audio.get_wav_data())
+    buf.name = "audio.wav"
+    return buf
+
+
+def _wav_seconds(path: str) -> Optional[float]:
+    """Duration of a WAV file, or None if it is not a readable WAV."""
+    try:
+        with wave.open(path, "rb") as wav:
+            return wav.getnframes() / wav.getframerate()
+    except (wave.Error, EOFError, OSError):
+        return None
+
+
+# Whisper is trained on 30 s windows; longer clips are split with a 1 s overlap
+WHISPER_WINDOW_SECONDS = 30
+WHISPER_OVERLAP_SECONDS = 1
+WHISPER_WINDOW_WORKERS = 4
+
+
+def _whisper_windows(audio: "sr.AudioData") -> List[io.BytesIO]:
+    """Split captured audio into overlapping Whisper-sized WAV uploads."""
+    raw = audio.get_raw_data()
+    bytes_per_second = audio.sample_rate * audio.sample_width
+    window = WHISPER_WINDOW_SECONDS * bytes_per_second
+    if len(raw) <= window:
+        return [_wav_upload(audio)]
+    step = (WHISPER_WINDOW_SECONDS - WHISPER_OVERLAP_SECONDS) * bytes_per_second
+    return [
+        _wav_upload(sr.AudioData(raw[start:start + window], audio.sample_rate, audio.sample_width))
+        for start in range(0, len(raw) - WHISPER_OVERLAP_SECONDS * bytes_per_second, step)
+    ]
+
+
+def _stitch_windows(transcripts: list) -> str:
+    """
+    Join per-window transcripts, splitting each overlap at its midpoint.
+
+    Uses word timestamps; a window without them contributes its full text.
+    """
+    half_overlap = WHISPER_OVERLAP_SECONDS / 2
+    last = len(transcripts) - 1
+    parts = []
+    for i, transcript in enumerate(transcripts):
+        words = getattr(transcript, "words", None)
+        if not words:
+            parts.append(transcript.text.strip())
+            continue
+        for word in words:
+            start = word["start"] if isinstance(word, dict) else word.start
+            if i > 0 and start < half_overlap:
+                continue
+            if i < last and start >= WHISPER_WINDOW_SECONDS - half_overlap:
+                continue
+            parts.append((word["word"] if isinstance(word, dict) else word.word).strip())
+    return " ".join(part for part in parts if part)
+
+
+def _whole_samples(data: bytes, width: int = 2) -> tuple:
+    """Split PCM bytes into whole samples and the partial sample left over."""
+    usable = len(data) - len(data) % width
+    return data[:usable], data[usable:]
+
+
+def _pcm_wav(pcm: bytes, rate: int) -> bytes:
+    """Wrap 16-bit mono PCM in a WAV container."""
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(rate)
+        wav.writeframes(pcm)
+    return buf.getvalue()
+
+
+def _play_wav(data: bytes) -> None:
+    """Play in-memory WAV audio on the default output device."""
+    with wave.open(io.BytesIO(data), "rb") as wav:
+        player = pyaudio.PyAudio()
+        try:
+            stream = player.open(
+                format=player.get_format_from_width(wav.getsampwidth()),
+                channels=wav.getnchannels(),
+                rate=wav.getframerate(),
+                output=True,
+            )
+            stream.write(wav.readframes(wav.getnframes()))
+            stream.stop_stream()
+            stream.close()
+        finally:
+            player.terminate()
+
+
+# RAM-backed on Linux, so staged audio never touches the disk
+SHM_DIR = "/dev/shm"
+
+
+@functools.lru_cache(maxsize=None)
+def audio_tmpdir() -> Optional[str]:
+    """Directory for staged audio: AUDIO_TMPDIR, else /dev/shm if writable, else the system default."""
+    configured = os.getenv("AUDIO_TMPDIR")
+    if configured:
+        return configured
+    if os.path.isdir(SHM_DIR) and os.access(SHM_DIR, os.W_OK | os.X_OK):
+        return SHM_DIR
+    return None
+
+
+def audio_temp_path(suffix: str = ".wav", directory: Optional[str] = None) -> str:
+    """Create a unique, empty temp file for audio (in audio_tmpdir() by default) and return its path."""
+    with tempfile.NamedTemporaryFile(
+        suffix=suffix, dir=directory or audio_tmpdir(), delete=False
+    ) as tf:
+        return tf.name
+
+
+class AudioTooLarge(ValueError):
+    """An audio upload exceeded the size limit."""
+
+
+def save_audio_upload(src: BinaryIO, max_bytes: int, suffix: str = ".wav") -> str:
+    """
+    Copy an uploaded audio stream into a temp file and return its path.
+
+    Raises AudioTooLarge past max_bytes. If the staging directory fills up
+    (Docker gives /dev/shm only 64 MB by default), the copy is retried in the
+    system temp dir.
+    """
+    fallback = tempfile.gettempdir()
+    directory = audio_tmpdir() or fallback
+    while True:
+        path = audio_temp_path(suffix, directory)
+        try:
+            copied = 0
+            with open(path, "wb") as dst:
+                for block in iter(lambda: src.read(1 << 16), b""):
+                    copied += len(block)
+                    if copied > max_bytes:
+                        raise AudioTooLarge(f"Audio upload exceeds {max_bytes} bytes")
+                    dst.write(block)
+            return path
+        except OSError as e:
+            remove_audio_file(path)
+            if e.errno != errno.ENOSPC or directory == fallback:
+                raise
+            src.seek(0)
+            directory = fallback
+        except BaseException:
+            remove_audio_file(path)
+            raise
+
+
+def remove_audio_file(path: Optional[str]) -> None:
+    """Delete a temp audio file, ignoring one that is already gone."""
+    if not path:
+        return
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+
+# 16 kHz mono in ~32 ms chunks keeps capture buffering (and latency) low
+MIC_SAMPLE_RATE = 16000
+MIC_CHUNK_SIZE = 512
+
+# Endpointing for the streaming capture path
+CAPTURE_PREROLL_MS = 300
+CAPTURE_END_SILENCE_MS = 500
+CAPTURE_MAX_SECONDS = 60
+
+
+class AudioCapture:
+    """
+    Microphone capture on PortAudio's callback thread, endpointed with webrtcvad.
+
+    The callback only copies frames into a queue while a recording is in progress,
+    so reading and voice detection never hold up the audio device.
+    """
+
+    FRAME_SAMPLES = MIC_SAMPLE_RATE * VAD_FRAME_MS // 1000
+
+    def __init__(self, aggressiveness: int = 2):
+        self._vad = webrtcvad.Vad(aggressiveness)
+        self._frames: "queue.SimpleQueue[bytes]" = queue.SimpleQueue()
+        self._recording = threading.Event()
+        self._pyaudio = pyaudio.PyAudio()
+        self._stream = self._pyaudio.open(
+            format=pyaudio.paInt16,
+            channels=1,
+            rate=MIC_SAMPLE_RATE,
+            input=True,
+            frames_per_buffer=self.FRAME_SAMPLES,
+            stream_callback=self._on_audio,
+        )
+
+    def _on_audio(self, in_data, frame_count, time_info, status):
+        if self._recording.is_set():
+            self._frames.put_nowait(in_data)
+        return None, pyaudio.paContinue
+
+    def _drain(self) -> None:
+        while True:
+            try:
+                self._frames.get_nowait()
+            except queue.Empty:
+                return
+
+    def record(self, timeout: float = 10) -> "sr.AudioData":
+        """Record one utterance, from just before speech starts until a pause."""
+        frame_ms = VAD_FRAME_MS
+        preroll = deque(maxlen=CAPTURE_PREROLL_MS // frame_ms)
+        utterance: List[bytes] = []
+        silent_frames = 0
+        deadline = time.monotonic() + timeout
+
+        self._drain()
+        self._recording.set()
+        try:
+            while True:
+                if not utterance and time.monotonic() >= deadline:
+                    raise sr.WaitTimeoutError("listening timed out while waiting for phrase to start")
+                try:
+                    frame = self._frames.get(timeout=timeout)
+                except queue.Empty:
+                    # The device stopped delivering audio
+                    if utterance:
+                        break
+                    raise sr.WaitTimeoutError("no audio received from the microphone")
+
+                voiced = self._vad.is_speech(frame, MIC_SAMPLE_RATE)
+                if not utterance:
+                    preroll.append(frame)
+                    if voiced:
+                        utterance.extend(preroll)
+                    continue
+
+                utterance.append(frame)
+                silent_frames = 0 if voiced else silent_frames + 1
+                if (
+                    silent_frames * frame_ms >= CAPTURE_END_SILENCE_MS
+                    or len(utterance) * frame_ms >= CAPTURE_MAX_SECONDS * 1000
+                ):
+                    break
+        finally:
+            self._recording.clear()
+        return sr.AudioData(b"".join(utterance), MIC_SAMPLE_RATE, 2)
+
+    def close(self) -> None:
+        """Stop the stream and release the audio device."""
+        self._stream.stop_stream()
+        self._stream.close()
+        self._pyaudio.terminate()
+
+
+class AudioInput:
+    """Low-latency audio capture shared by the SpeechRecognition-based providers."""
+
+    def __init__(self):
+        self.recognizer = sr.Recognizer()
+        self.recognizer.energy_threshold = 300
+        # End the utterance soon after the speaker stops
+        self.recognizer.pause_threshold = 0.5
+        self.recognizer.non_speaking_duration = 0.3
+        # The microphone stream is opened on first use and then kept open
+        self._microphone: Optional["sr.Microphone"] = None
+        self._source = None
+        self._capture: Optional[AudioCapture] = None
+        self._lock = threading.Lock()
+
+    def _open_microphone(self):
+        """Open the microphone once, calibrating for ambient noise."""
+        if self._source is None:
+            self._microphone = sr.Microphone(
+                sample_rate=MIC_SAMPLE_RATE, chunk_size=MIC_CHUNK_SIZE
+            )
+            self._source = self._microphone.__enter__()
+            atexit.register(self.close)
+            self.recognizer.adjust_for_ambient_noise(self._source, duration=0.3)
+        return self._source
+
+    def _open_capture(self) -> AudioCapture:
+        """Start the callback-driven capture stream once."""
+        if self._capture is None:
+            self._capture = AudioCapture()
+            atexit.register(self.close)
+        return self._capture
+
+    def close(self) -> None:
+        """Release the microphone stream, if open."""
+        with self._lock:
+            if self._capture is not None:
+                self._capture.close()
+                self._capture = None
+            if self._microphone is not None:
+                self._microphone.__exit__(None, None, None)
+                self._microphone = None
+                self._source = None
+
+    def capture(self, path: Optional[str] = None) -> "sr.AudioData":
+        """Read audio from a WAV/AIFF/FLAC file, or record one utterance from the microphone."""
+        if path:
+            with sr.AudioFile(path) as source:
+                return self.recognizer.record(source)
+        # One stream, one reader at a time
+        with self._lock:
+            if pyaudio and webrtcvad:
+                return self._open_capture().record(timeout=10)
+            return self.recognizer.listen(self._open_microphone(), timeout=10)
+
+
 class OpenAITTS(TextToSpeech):
     """OpenAI Text-to-Speech implementation."""
 
-    def __init__(self, api_key: str, voice: str = "nova"):
+    audio_media_type = "audio/mpeg"
+
+    def __init__(
+        self, api_key: str, voice: str = "nova", http_client=None, async_http_client=None
+    ):
         if not OpenAI:
             raise ImportError("openai package is required. Install with: pip install openai")
-        self.client = OpenAI(api_key=api_key)
+        self.client = OpenAI(api_key=api_key, http_client=http_client)
+        self.aclient = AsyncOpenAI(api_key=api_key, http_client=async_http_client)
         self.voice = voice
+        self._pyaudio = None
+
+    # OpenAI "pcm" output: 24 kHz, 16-bit signed, mono
+    PCM_RATE = 24000
+
+    def _open_output(self):
+        """Open a PyAudio output stream for OpenAI PCM audio."""
+        if self._pyaudio is None:
+            self._pyaudio = pyaudio.PyAudio()
+        return self._pyaudio.open(
+            format=pyaudio.paInt16, channels=1, rate=self.PCM_RATE, output=True
+        )
 
     def speak(self, text: str) -> None:
-        """Convert text to speech using OpenAI API."""
+        """Convert text to speech using OpenAI API and play it as it streams in."""
+        if not pyaudio:
+            # No audio output available; nothing to play the synthesis on
+            print(f"[TTS Output]: {text}")
+            return
+
+        with self.client.audio.speech.with_streaming_response.create(
+            model="tts-1",
+            voice=self.voice,
+            input=text,
+            response_format="pcm",
+        ) as response:
+            stream = self._open_output()
+            try:
+                pending = b""
+                for chunk in response.iter_bytes(4096):
+                    samples, pending = _whole_samples(pending + chunk)
+                    stream.write(samples)
+            finally:
+                stream.stop_stream()
+                stream.close()
+
+    async def speak_async(self, text: str) -> None:
+        """Stream speech with the async client; only the blocking device writes use a thread."""
+        if not pyaudio:
+            print(f"[TTS Output]: {text}")
+            return
+
+        async with self.aclient.audio.speech.with_streaming_response.create(
+            model="tts-1",
+            voice=self.voice,
+            input=text,
+            response_format="pcm",
+        ) as response:
+            stream = self._open_output()
+            try:
+                pending = b""
+                async for chunk in response.iter_bytes(4096):
+                    samples, pending = _whole_samples(pending + chunk)
+                    await asyncio.to_thread(stream.write, samples)
+            finally:
+                stream.stop_stream()
+                stream.close()
+
+    def synthesize(self, text: str) -> bytes:
+        """Synthesize text to WAV bytes without playing it."""
         response = self.client.audio.speech.create(
             model="tts-1",
             voice=self.voice,
             input=text,
+            response_format="pcm",
         )
-        # Play audio (simplified - in production would save/stream)
-        print(f"[TTS Output]: {text}")
+        return _pcm_wav(response.content, self.PCM_RATE)
 
-    async def speak_async(self, text: str) -> None:
-        """Async wrapper for OpenAI TTS."""
-        loop = asyncio.get_event_loop()
-        await loop.run_in_executor(None, self.speak, text)
+    async def synthesize_stream(self, text: str) -> AsyncIterator[bytes]:
+        """Stream MP3 audio from OpenAI as it is generated."""
+        async with self.aclient.audio.speech.with_streaming_response.create(
+            model="tts-1",
+            voice=self.voice,
+            input=text,
+            response_format="mp3",
+        ) as response:
+            async for chunk in response.iter_bytes(4096):
+                yield chunk
 
 
 class AzureTTS(TextToSpeech):
@@ -104,17 +566,110 @@ class AzureTTS(TextToSpeech):
             subscription=api_key, region=region
         )
         self.speech_config.speech_synthesis_voice_name = "en-US-AriaNeural"
+        # Synthesizers keep their service connection open, so each is built once
+        # (on first use, so a headless server never binds the speaker)
+        self._speaker_synth = None
+        self._memory_synth = None
+        self._lock = threading.Lock()
+
+    def _speaker_synthesizer(self):
+        if self._speaker_synth is None:
+            self._speaker_synth = speechsdk.SpeechSynthesizer(speech_config=self.speech_config)
+        return self._speaker_synth
+
+    def _memory_synthesizer(self):
+        if self._memory_synth is None:
+            self._memory_synth = speechsdk.SpeechSynthesizer(
+                speech_config=self.speech_config, audio_config=None
+            )
+        return self._memory_synth
+
+    def warmup(self) -> None:
+        """Open the synthesis connection ahead of the first request."""
+        with self._lock:
+            connection = speechsdk.Connection.from_speech_synthesizer(self._memory_synthesizer())
+            connection.open(True)
 
     def speak(self, text: str) -> None:
         """Convert text to speech using Azure."""
-        synthesizer = speechsdk.SpeechSynthesizer(speech_config=self.speech_config)
-        synthesizer.speak_text_async(text).get()
+        with self._lock:
+            self._speaker_synthesizer().speak_text_async(text).get()
 
     async def speak_async(self, text: str) -> None:
         """Async wrapper for Azure TTS."""
         loop = asyncio.get_event_loop()
         await loop.run_in_executor(None, self.speak, text)
 
+    def synthesize(self, text: str) -> bytes:
+        """Synthesize text to WAV bytes without playing it."""
+        with self._lock:
+            return self._memory_synthesizer().speak_text_async(text).get().audio_data
+
+    async def synthesize_stream(self, text: str) -> AsyncIterator[bytes]:
+        """Yield the synthesized WAV audio."""
+        yield await asyncio.to_thread(self.synthesize, text)
+
+
+class _SpeechEngine:
+    """Owns the process-wide pyttsx3 engine and runs all its work on one thread."""
+
+    def __init__(self):
+        self._jobs: "queue.Queue[Optional[tuple]]" = queue.Queue()
+        ready: Future = Future()
+        self._thread = threading.Thread(
+            target=self._run, args=(ready,), name="pyttsx3-engine", daemon=True
+        )
+        self._thread.start()
+        # Surface init failures (e.g. no speech driver) to the caller
+        ready.result()
+        atexit.register(self.shutdown)
+
+    def _run(self, ready: Future) -> None:
+        try:
+            # Created on the worker thread, which then owns it (COM on Windows)
+            engine = pyttsx3.init()
+            engine.setProperty("rate", 150)
+            engine.setProperty("volume", 0.9)
+        except Exception as e:
+            ready.set_exception(e)
+            return
+        ready.set_result(None)
+        while (item := self._jobs.get()) is not None:
+            job, future = item
+            try:
+                future.set_result(job(engine))
+            except Exception as e:
+                future.set_exception(e)
+
+    def submit(self, job: Callable[[Any], Any]) -> Future:
+        """Queue job(engine) on the engine thread; returns its future."""
+        future: Future = Future()
+        self._jobs.put((job, future))
+        return future
+
+    def shutdown(self) -> None:
+        """Let queued speech finish, then stop the engine thread."""
+        self._jobs.put(None)
+        self._thread.join(timeout=30)
+
+
+_speech_engine: Optional[_SpeechEngine] = None
+_speech_engine_lock = threading.Lock()
+
+
+def _get_speech_engine() -> _SpeechEngine:
+    """Start the shared pyttsx3 engine on first use."""
+    global _speech_engine
+    with _speech_engine_lock:
+        if _speech_engine is None:
+            _speech_engine = _SpeechEngine()
+        return _speech_engine
+
+
+def _say(engine, text: str) -> None:
+    engine.say(text)
+    engine.runAndWait()
+
 
 class LocalTTS(TextToSpeech):
     """Local Text-to-Speech implementation using pyttsx3."""
@@ -122,21 +677,75 @@ class LocalTTS(TextToSpeech):
     def __init__(self):
         if not pyttsx3:
             raise ImportError("pyttsx3 is required. Install with: pip install pyttsx3")
-        self.engine = pyttsx3.init()
-        self.engine.setProperty("rate", 150)
-        self.engine.setProperty("volume", 0.9)
+        # One engine per process, driven by its own thread
+        self.engine = _get_speech_engine()
+
+    def speak(self, text: str) -> None:
+        """Queue text to be spoken locally and return without waiting for playback."""
+        print(f"[TTS Output]: {text}")
+        self.engine.submit(lambda engine: _say(engine, text))
+
+    async def speak_async(self, text: str) -> None:
+        """Speak locally and wait for playback to finish, without holding a thread."""
+        print(f"[TTS Output]: {text}")
+        await asyncio.wrap_future(self.engine.submit(lambda engine: _say(engine, text)))
+
+    def synthesize(self, text: str) -> bytes:
+        """Render text to WAV bytes without playing it."""
+        path = audio_temp_path()
+
+        def render(engine) -> None:
+            engine.save_to_file(text, path)
+            engine.runAndWait()
+
+        try:
+            self.engine.submit(render).result()
+            with open(path, "rb") as f:
+                return f.read()
+        finally:
+            remove_audio_file(path)
+
+    async def synthesize_stream(self, text: str) -> AsyncIterator[bytes]:
+        """Yield the rendered WAV audio."""
+        yield await asyncio.to_thread(self.synthesize, text)
+
+
+class GoogleTTS(TextToSpeech):
+    """Google Cloud Text-to-Speech implementation."""
+
+    def __init__(self, credentials_path: str, voice: str = "en-US-Neural2-F"):
+        if not texttospeech:
+            raise ImportError("google-cloud-texttospeech is required")
+        os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = credentials_path
+        self.client = texttospeech.TextToSpeechClient()
+        self.voice = voice
+
+    def synthesize(self, text: str) -> bytes:
+        """Synthesize text to WAV bytes without playing it."""
+        response = self.client.synthesize_speech(
+            input=texttospeech.SynthesisInput(text=text),
+            voice=texttospeech.VoiceSelectionParams(language_code="en-US", name=self.voice),
+            audio_config=texttospeech.AudioConfig(
+                audio_encoding=texttospeech.AudioEncoding.LINEAR16
+            ),
+        )
+        return response.audio_content
 
     def speak(self, text: str) -> None:
-        """Convert text to speech locally."""
+        """Convert text to speech using Google and play it."""
         print(f"[TTS Output]: {text}")
-        self.engine.say(text)
-        self.engine.runAndWait()
+        if pyaudio:
+            _play_wav(self.synthesize(text))
 
     async def speak_async(self, text: str) -> None:
-        """Async wrapper for local TTS."""
+        """Async wrapper for Google TTS."""
         loop = asyncio.get_event_loop()
         await loop.run_in_executor(None, self.speak, text)
 
+    async def synthesize_stream(self, text: str) -> AsyncIterator[bytes]:
+        """Yield the synthesized WAV audio."""
+        yield await asyncio.to_thread(self.synthesize, text)
+
 
 class GoogleSTT(SpeechToText):
     """Google Cloud Speech-to-Text implementation."""
@@ -146,21 +755,22 @@ class GoogleSTT(SpeechToText):
             raise ImportError("google-cloud-speech is required")
         os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = credentials_path
         self.client = speech_v1.SpeechClient()
+        self.audio_input = AudioInput()
 
-    def listen(self) -> Optional[str]:
+    def listen(self, path: Optional[str] = None) -> Optional[str]:
         """Listen to audio and convert to text using Google."""
-        recognizer = sr.Recognizer()
-        with sr.Microphone() as source:
-            audio = recognizer.listen(source, timeout=10)
+        audio = self.audio_input.capture(path)
+        if not path and not _has_speech(audio):
+            return None
         try:
-            return recognizer.recognize_google(audio)
+            return self.audio_input.recognizer.recognize_google(audio)
         except sr.UnknownValueError:
             return None
 
-    async def listen_async(self) -> Optional[str]:
+    async def listen_async(self, path: Optional[str] = None) -> Optional[str]:
         """Async wrapper for Google STT."""
         loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.listen)
+        return await loop.run_in_executor(None, self.listen, path)
 
 
 class AzureSTT(SpeechToText):
@@ -172,114 +782,632 @@ class AzureSTT(SpeechToText):
         self.speech_config = speechsdk.SpeechConfig(
             subscription=api_key, region=region
         )
+        # The microphone recognizer is built once and reused across utterances
+        self._mic_recognizer = None
+        self._lock = threading.Lock()
+
+    def _recognize_microphone(self):
+        with self._lock:
+            if self._mic_recognizer is None:
+                self._mic_recognizer = speechsdk.SpeechRecognizer(speech_config=self.speech_config)
+            return self._mic_recognizer.recognize_once()
 
-    def listen(self) -> Optional[str]:
+    def listen(self, path: Optional[str] = None) -> Optional[str]:
         """Listen to audio and convert to text using Azure."""
-        speech_recognizer = speechsdk.SpeechRecognizer(
-            speech_config=self.speech_config
-        )
-        result = speech_recognizer.recognize_once()
+        if path:
+            # File input is bound at construction, so each file needs its own recognizer
+            speech_recognizer = speechsdk.SpeechRecognizer(
+                speech_config=self.speech_config,
+                audio_config=speechsdk.audio.AudioConfig(filename=path),
+            )
+            result = speech_recognizer.recognize_once()
+        else:
+            result = self._recognize_microphone()
 
         if result.reason == speechsdk.ResultReason.RecognizedSpeech:
             return result.text
         return None
 
-    async def listen_async(self) -> Optional[str]:
+    async def listen_async(self, path: Optional[str] = None) -> Optional[str]:
         """Async wrapper for Azure STT."""
         loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.listen)
+        return await loop.run_in_executor(None, self.listen, path)
 
 
 class OpenAISTT(SpeechToText):
     """OpenAI Whisper Speech-to-Text implementation."""
 
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, http_client=None, async_http_client=None):
         if not OpenAI:
             raise ImportError("openai package is required")
-        self.client = OpenAI(api_key=api_key)
+        self.client = OpenAI(api_key=api_key, http_client=http_client)
+        self.aclient = AsyncOpenAI(api_key=api_key, http_client=async_http_client)
+        self.audio_input = AudioInput()
+
+    # Word timestamps let overlapping windows be stitched back together
+    _WINDOW_OPTIONS = {"response_format": "verbose_json", "timestamp_granularities": ["word"]}
 
-    def listen(self) -> Optional[str]:
+    def _transcribe(self, audio: "sr.AudioData") -> str:
+        """Transcribe captured audio, in concurrent 30 s windows if it is longer."""
+        windows = _whisper_windows(audio)
+        if len(windows) == 1:
+            return self.client.audio.transcriptions.create(model="whisper-1", file=windows[0]).text
+        with ThreadPoolExecutor(max_workers=WHISPER_WINDOW_WORKERS) as pool:
+            transcripts = list(pool.map(
+                lambda window: self.client.audio.transcriptions.create(
+                    model="whisper-1", file=window, **self._WINDOW_OPTIONS
+                ),
+                windows,
+            ))
+        return _stitch_windows(transcripts)
+
+    async def _atranscribe(self, audio: "sr.AudioData") -> str:
+        """Async version of _transcribe; windows are uploaded concurrently."""
+        windows = _whisper_windows(audio)
+        if len(windows) == 1:
+            transcript = await self.aclient.audio.transcriptions.create(
+                model="whisper-1", file=windows[0]
+            )
+            return transcript.text
+        transcripts = await asyncio.gather(*(
+            self.aclient.audio.transcriptions.create(
+                model="whisper-1", file=window, **self._WINDOW_OPTIONS
+            )
+            for window in windows
+        ))
+        return _stitch_windows(transcripts)
+
+    def listen(self, path: Optional[str] = None) -> Optional[str]:
         """Listen to audio and convert to text using OpenAI Whisper."""
-        recognizer = sr.Recognizer()
-        with sr.Microphone() as source:
+        if path:
             try:
-                audio = recognizer.listen(source, timeout=10)
-            except sr.RequestError:
+                seconds = _wav_seconds(path)
+                if seconds is not None and seconds > WHISPER_WINDOW_SECONDS:
+                    return self._transcribe(self.audio_input.capture(path))
+                with open(path, "rb") as f:
+                    transcript = self.client.audio.transcriptions.create(
+                        model="whisper-1", file=f
+                    )
+                return transcript.text
+            except Exception:
                 return None
 
-        # Save audio to temporary file and send to OpenAI
         try:
-            with open("temp_audio.wav", "wb") as f:
-                f.write(audio.get_wav_data())
+            audio = self.audio_input.capture()
+        except sr.RequestError:
+            return None
+        # Don't pay for (or let Whisper hallucinate on) silence and noise
+        if not _has_speech(audio):
+            return None
 
-            with open("temp_audio.wav", "rb") as f:
-                transcript = self.client.audio.transcriptions.create(
-                    model="whisper-1", file=f
-                )
-            return transcript.text
+        try:
+            return self._transcribe(audio)
         except Exception:
             return None
-        finally:
-            if os.path.exists("temp_audio.wav"):
-                os.remove("temp_audio.wav")
 
-    async def listen_async(self) -> Optional[str]:
-        """Async wrapper for OpenAI STT."""
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.listen)
+    async def listen_async(self, path: Optional[str] = None) -> Optional[str]:
+        """Transcribe with the async client; only microphone capture uses a thread."""
+        if path:
+            try:
+                seconds = await asyncio.to_thread(_wav_seconds, path)
+                if seconds is not None and seconds > WHISPER_WINDOW_SECONDS:
+                    audio = await asyncio.to_thread(self.audio_input.capture, path)
+                    return await self._atranscribe(audio)
+                with open(path, "rb") as f:
+                    transcript = await self.aclient.audio.transcriptions.create(
+                        model="whisper-1", file=f
+                    )
+                return transcript.text
+            except Exception:
+                return None
+
+        try:
+            audio = await asyncio.to_thread(self.audio_input.capture)
+        except sr.RequestError:
+            return None
+        if not await asyncio.to_thread(_has_speech, audio):
+            return None
+
+        try:
+            return await self._atranscribe(audio)
+        except Exception:
+            return None
 
 
 class LocalSTT(SpeechToText):
     """Local Speech-to-Text using Google's free API."""
 
     def __init__(self):
-        self.recognizer = sr.Recognizer()
+        self.audio_input = AudioInput()
 
-    def listen(self) -> Optional[str]:
+    def listen(self, path: Optional[str] = None) -> Optional[str]:
         """Listen to audio and convert to text locally."""
-        with sr.Microphone() as source:
-            try:
+        try:
+            if not path:
                 print("Listening...")
-                audio = self.recognizer.listen(source, timeout=10)
-                print("Processing audio...")
-                return self.recognizer.recognize_google(audio)
-            except sr.UnknownValueError:
-                return None
-            except sr.RequestError:
+            audio = self.audio_input.capture(path)
+            if not path and not _has_speech(audio):
                 return None
+            print("Processing audio...")
+            return self.audio_input.recognizer.recognize_google(audio)
+        except sr.UnknownValueError:
+            return None
+        except sr.RequestError:
+            return None
 
-    async def listen_async(self) -> Optional[str]:
+    async def listen_async(self, path: Optional[str] = None) -> Optional[str]:
         """Async wrapper for local STT."""
         loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.listen)
+        return await loop.run_in_executor(None, self.listen, path)
+
+
+# Whisper models take 16 kHz mono float32 samples
+WHISPER_SAMPLE_RATE = 16000
+
+
+def _whisper_samples(audio: "sr.AudioData") -> "np.ndarray":
+    """Convert captured audio straight to Whisper's input array, skipping WAV encoding."""
+    pcm = audio.get_raw_data(convert_rate=WHISPER_SAMPLE_RATE, convert_width=2)
+    return np.frombuffer(pcm, dtype=np.int16).astype(np.float32) / 32768.0
+
+
+class FasterWhisperSTT(SpeechToText):
+    """Local Whisper Speech-to-Text using faster-whisper (CTranslate2)."""
+
+    # Utterances shorter than this go to the small, fast model
+    SHORT_UTTERANCE_SECONDS = 5.0
+
+    def __init__(
+        self,
+        model_size: str = None,
+        compute_type: str = None,
+        short_model_size: str = None,
+    ):
+        if not WhisperModel:
+            raise ImportError("faster-whisper is required. Install with: pip install faster-whisper")
+        self.audio_input = AudioInput()
+        compute_type = compute_type or os.getenv("WHISPER_COMPUTE", "int8")
+        # Models are loaded once and shared by every request
+        self.model = WhisperModel(
+            model_size or os.getenv("WHISPER_MODEL", "small"),
+            device="auto",
+            compute_type=compute_type,
+        )
+        # Whisper-tiny is ~19x faster than medium (~1.8x faster than base) and
+        # accurate enough for short, in-domain requests; empty disables it
+        if short_model_size is None:
+            short_model_size = os.getenv("WHISPER_SHORT_MODEL", "tiny.en")
+        self.short_model = (
+            WhisperModel(short_model_size, device="auto", compute_type=compute_type)
+            if short_model_size else None
+        )
+
+    def _model_for(self, seconds: Optional[float]):
+        """Pick the short-utterance model when the clip is known to be short."""
+        if self.short_model and seconds is not None and seconds < self.SHORT_UTTERANCE_SECONDS:
+            return self.short_model
+        return self.model
+
+    def transcribe(self, audio, seconds: Optional[float] = None) -> Optional[str]:
+        """Transcribe a file path, binary stream or 16 kHz float32 array."""
+        model = self._model_for(seconds)
+        segments, _ = model.transcribe(audio, beam_size=1, vad_filter=True)
+        text = "".join(segment.text for segment in segments).strip()
+        return text or None
+
+    @staticmethod
+    def _prime(model) -> None:
+        """Run a full encode and decode on a second of silence."""
+        silence = np.zeros(WHISPER_SAMPLE_RATE, dtype=np.float32)
+        # vad_filter would strip the silence before anything is decoded, and
+        # segments are generated lazily, so they must be consumed
+        segments, _ = model.transcribe(silence, beam_size=1, vad_filter=False)
+        list(segments)
+
+    def warmup(self) -> None:
+        """Run one inference per model so the first request skips the cold start."""
+        self._prime(self.model)
+        if self.short_model:
+            self._prime(self.short_model)
+
+    def listen(self, path: Optional[str] = None) -> Optional[str]:
+        """Listen to audio and convert to text with faster-whisper."""
+        if path:
+            return self.transcribe(path, _wav_seconds(path))
+        try:
+            print("Listening...")
+            audio = self.audio_input.capture()
+        except sr.WaitTimeoutError:
+            return None
+        print("Processing audio...")
+        samples = _whisper_samples(audio)
+        return self.transcribe(samples, len(samples) / WHISPER_SAMPLE_RATE)
+
+    async def listen_async(self, path: Optional[str] = None) -> Optional[str]:
+        """Async wrapper for faster-whisper STT."""
+        return await asyncio.to_thread(self.listen, path)
+
+
+# ==================== Parallel Synthesis ====================
+
+_SENTENCE_RE = re.compile(r"(?<=[.!?])\s+")
+# Encodings whose independently synthesized segments can be played back to back
+# (joined Ogg files form a chained stream that many decoders stop reading after the first)
+CONCATENABLE_MEDIA_TYPES = frozenset(("audio/mpeg",))
+
+
+def _sentences(text: str) -> List[str]:
+    return [segment for segment in _SENTENCE_RE.split(text.strip()) if segment]
+
+
+class ParallelTTS(TextToSpeech):
+    """Wraps a TTS provider and synthesizes long replies sentence by sentence in parallel."""
+
+    def __init__(self, inner: TextToSpeech, concurrency: int = 3):
+        self.inner = inner
+        self.audio_media_type = getattr(inner, "audio_media_type", TextToSpeech.audio_media_type)
+        self.concurrency = concurrency
+
+    def speak(self, text: str) -> None:
+        """Play text through the wrapped provider."""
+        self.inner.speak(text)
+
+    async def speak_async(self, text: str) -> None:
+        """
+        Play each sentence in order while later ones synthesize.
+
+        The first sentence streams through the provider's own playback while
+        the rest are rendered in the background; short replies (or no output
+        device) use the provider directly.
+        """
+        segments = _sentences(text)
+        if len(segments) < 2 or not pyaudio:
+            await self.inner.speak_async(text)
+            return
+
+        slots = asyncio.Semaphore(self.concurrency)
+
+        async def render(segment: str) -> bytes:
+            async with slots:
+                return await asyncio.to_thread(self.inner.synthesize, segment)
+
+        tasks = [asyncio.create_task(render(segment)) for segment in segments[1:]]
+        try:
+            await self.inner.speak_async(segments[0])
+            for task in tasks:
+                await asyncio.to_thread(self.inner.play, await task)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def synthesize(self, text: str) -> bytes:
+        return self.inner.synthesize(text)
+
+    def play(self, audio: bytes) -> None:
+        self.inner.play(audio)
+
+    def warmup(self) -> None:
+        self.inner.warmup()
+
+    async def synthesize_stream(self, text: str) -> AsyncIterator[bytes]:
+        """
+        Yield audio for each sentence in order while later ones synthesize.
+
+        Up to `concurrency` sentences are rendered at once, so the first audio
+        is ready after one sentence rather than the whole reply. Encodings that
+        cannot be concatenated (e.g. WAV) are streamed in one piece.
+        """
+        segments = _sentences(text)
+        if len(segments) < 2 or self.audio_media_type not in CONCATENABLE_MEDIA_TYPES:
+            async for chunk in self.inner.synthesize_stream(text):
+                yield chunk
+            return
+
+        slots = asyncio.Semaphore(self.concurrency)
+
+        async def render(segment: str) -> bytes:
+            async with slots:
+                return b"".join([chunk async for chunk in self.inner.synthesize_stream(segment)])
+
+        tasks = [asyncio.create_task(render(segment)) for segment in segments]
+        try:
+            for task in tasks:
+                yield await task
+        finally:
+            for task in tasks:
+                task.cancel()
+
+
+# ==================== Result Caching ====================
+
+class _TTLCache:
+    """Small thread-safe LRU cache whose entries expire after `ttl` seconds."""
+
+    def __init__(self, maxsize: int = 512, ttl: float = 3600.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: bytes) -> Optional[Any]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires, value = entry
+            if expires < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: bytes, value: Any) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+
+def _file_digest(path: str) -> bytes:
+    """SHA-1 of a file's contents, read in chunks."""
+    digest = hashlib.sha1()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 16), b""):
+            digest.update(block)
+    return digest.digest()
+
+
+class CachingTTS(TextToSpeech):
+    """
+    Wraps a TTS provider and reuses synthesized audio for repeated text.
+
+    Audio is only stored once the same text misses a second time, so fixed
+    prompts (greeting, reprompts) are cached while one-off LLM sentences keep
+    the provider's streaming playback and take no cache memory.
+    """
+
+    def __init__(self, inner: TextToSpeech, maxsize: int = 512, ttl: float = 3600.0):
+        self.inner = inner
+        self.audio_media_type = getattr(inner, "audio_media_type", TextToSpeech.audio_media_type)
+        self._cache = _TTLCache(maxsize, ttl)
+        # Keys that have missed once; only digests are kept, not audio
+        self._missed = _TTLCache(maxsize * 4, ttl)
+
+    def _key(self, text: str, kind: str) -> bytes:
+        """Key on provider, voice and text; kind separates playback WAV from streamed audio."""
+        voice = getattr(self.inner, "voice", "")
+        return hashlib.sha1(f"{type(self.inner).__name__}:{voice}:{kind}:{text}".encode()).digest()
+
+    def _repeated(self, key: bytes) -> bool:
+        """Record a cache miss; True if the same key has missed before."""
+        if self._missed.get(key):
+            return True
+        self._missed.set(key, True)
+        return False
+
+    def _playback_audio(self, text: str) -> Optional[bytes]:
+        """Cached WAV for text, synthesized now if it is a repeat; None to stream instead."""
+        if not pyaudio:
+            # No output device to replay on; the provider handles its own fallback
+            return None
+        key = self._key(text, "wav")
+        audio = self._cache.get(key)
+        if audio is None and self._repeated(key):
+            audio = self.inner.synthesize(text)
+            self._cache.set(key, audio)
+        return audio
+
+    def speak(self, text: str) -> None:
+        """Replay cached audio for repeated prompts; anything else streams from the provider."""
+        audio = self._playback_audio(text)
+        if audio is None:
+            self.inner.speak(text)
+        else:
+            self.play(audio)
+
+    async def speak_async(self, text: str) -> None:
+        """Async version of speak."""
+        audio = await asyncio.to_thread(self._playback_audio, text)
+        if audio is None:
+            await self.inner.speak_async(text)
+        else:
+            await asyncio.to_thread(self.play, audio)
+
+    def synthesize(self, text: str) -> bytes:
+        """Return cached WAV audio for text, caching it once the text repeats."""
+        key = self._key(text, "wav")
+        audio = self._cache.get(key)
+        if audio is None:
+            audio = self.inner.synthesize(text)
+            if self._repeated(key):
+                self._cache.set(key, audio)
+        return audio
+
+    def play(self, audio: bytes) -> None:
+        self.inner.play(audio)
+
+    def warmup(self) -> None:
+        self.inner.warmup()
+
+    async def synthesize_stream(self, text: str) -> AsyncIterator[bytes]:
+        """Replay cached audio, or stream from the provider and cache repeated text."""
+        key = self._key(text, "stream")
+        cached = self._cache.get(key)
+        if cached is not None:
+            yield cached
+            return
+        if not self._repeated(key):
+            async for chunk in self.inner.synthesize_stream(text):
+                yield chunk
+            return
+        chunks = []
+        async for chunk in self.inner.synthesize_stream(text):
+            chunks.append(chunk)
+            yield chunk
+        # Only complete streams are cached; an aborted one never gets here
+        self._cache.set(key, b"".join(chunks))
+
+
+class CachingSTT(SpeechToText):
+    """Wraps an STT provider and reuses transcripts for identical audio files."""
+
+    def __init__(self, inner: SpeechToText, maxsize: int = 512, ttl: float = 3600.0):
+        self.inner = inner
+        self._cache = _TTLCache(maxsize, ttl)
+
+    def listen(self, path: Optional[str] = None) -> Optional[str]:
+        """Transcribe a file (cached by content hash) or listen on the microphone."""
+        if not path:
+            return self.inner.listen()
+        key = _file_digest(path)
+        text = self._cache.get(key)
+        if text is None:
+            text = self.inner.listen(path)
+            if text:
+                self._cache.set(key, text)
+        return text
+
+    async def listen_async(self, path: Optional[str] = None) -> Optional[str]:
+        """Async version of listen."""
+        if not path:
+            return await self.inner.listen_async()
+        key = await asyncio.to_thread(_file_digest, path)
+        text = self._cache.get(key)
+        if text is None:
+            text = await self.inner.listen_async(path)
+            if text:
+                self._cache.set(key, text)
+        return text
+
+    def warmup(self) -> None:
+        self.inner.warmup()
+
+
+# ==================== Provider Factories ====================
+
+def _make_openai_tts(api_key=None, http_client=None, async_http_client=None, **_) -> TextToSpeech:
+    api_key = api_key or os.getenv("OPENAI_API_KEY")
+    if not api_key:
+        raise ValueError("OpenAI API key not provided")
+    return OpenAITTS(
+        api_key=api_key, http_client=http_client, async_http_client=async_http_client
+    )
+
+
+def _make_azure_tts(api_key=None, azure_region=None, **_) -> TextToSpeech:
+    api_key = api_key or os.getenv("AZURE_SPEECH_KEY")
+    region = azure_region or os.getenv("AZURE_SPEECH_REGION")
+    if not api_key or not region:
+        raise ValueError("Azure credentials not provided")
+    return AzureTTS(api_key=api_key, region=region)
+
+
+def _make_google_tts(**_) -> TextToSpeech:
+    creds_path = os.getenv("GOOGLE_APPLICATION_CREDENTIALS")
+    if not creds_path:
+        raise ValueError("Google credentials path not provided")
+    return GoogleTTS(credentials_path=creds_path)
+
+
+def _make_local_tts(**_) -> TextToSpeech:
+    return LocalTTS()
+
+
+def _make_openai_stt(api_key=None, http_client=None, async_http_client=None, **_) -> SpeechToText:
+    api_key = api_key or os.getenv("OPENAI_API_KEY")
+    if not api_key:
+        raise ValueError("OpenAI API key not provided")
+    return OpenAISTT(
+        api_key=api_key, http_client=http_client, async_http_client=async_http_client
+    )
+
+
+def _make_azure_stt(api_key=None, azure_region=None, **_) -> SpeechToText:
+    api_key = api_key or os.getenv("AZURE_SPEECH_KEY")
+    region = azure_region or os.getenv("AZURE_SPEECH_REGION")
+    if not api_key or not region:
+        raise ValueError("Azure credentials not provided")
+    return AzureSTT(api_key=api_key, region=region)
+
+
+def _make_google_stt(google_creds_path=None, **_) -> SpeechToText:
+    creds_path = google_creds_path or os.getenv("GOOGLE_APPLICATION_CREDENTIALS")
+    if not creds_path:
+        raise ValueError("Google credentials path not provided")
+    return GoogleSTT(credentials_path=creds_path)
+
+
+def _make_faster_whisper_stt(**_) -> SpeechToText:
+    return FasterWhisperSTT()
+
+
+def _make_local_stt(**_) -> SpeechToText:
+    # faster-whisper is the better local option when installed
+    return FasterWhisperSTT() if WhisperModel else LocalSTT()
+
+
+_TTS_FACTORIES: Dict[str, Callable[..., TextToSpeech]] = {
+    VoiceProvider.OPENAI.value: _make_openai_tts,
+    VoiceProvider.AZURE.value: _make_azure_tts,
+    VoiceProvider.GOOGLE.value: _make_google_tts,
+    VoiceProvider.LOCAL.value: _make_local_tts,
+}
+
+_STT_FACTORIES: Dict[str, Callable[..., SpeechToText]] = {
+    VoiceProvider.OPENAI.value: _make_openai_stt,
+    VoiceProvider.AZURE.value: _make_azure_stt,
+    VoiceProvider.GOOGLE.value: _make_google_stt,
+    VoiceProvider.LOCAL.value: _make_local_stt,
+    VoiceProvider.FASTER_WHISPER.value: _make_faster_whisper_stt,
+}
+
+
+def _provider_name(provider=None) -> str:
+    """Normalize a provider (enum member, any-case string, or VOICE_PROVIDER) to a factory key."""
+    provider = provider or os.getenv("VOICE_PROVIDER", "local")
+    return getattr(provider, "value", provider).strip().lower()
+
+
+# Providers hold engines, models and HTTP clients, so each configuration is built once
+_provider_cache: Dict[tuple, Any] = {}
+_provider_cache_lock = threading.Lock()
+
+
+def _cached_provider(key: tuple, build: Callable[[], Any]) -> Any:
+    """Return the provider cached under key, building it on first request."""
+    with _provider_cache_lock:
+        provider = _provider_cache.get(key)
+        if provider is None:
+            provider = _provider_cache[key] = build()
+        return provider
+
+
+def clear_provider_cache() -> None:
+    """Forget cached providers (their HTTP clients are closed on shutdown)."""
+    with _provider_cache_lock:
+        _provider_cache.clear()
 
 
 def get_tts_provider(
     provider: str = None,
     api_key: str = None,
     azure_region: str = None,
+    http_client=None,
+    async_http_client=None,
 ) -> TextToSpeech:
-    """Factory function to get TTS provider."""
-    provider = provider or os.getenv("VOICE_PROVIDER", "local").lower()
-
-    if provider == VoiceProvider.OPENAI:
-        api_key = api_key or os.getenv("OPENAI_API_KEY")
-        if not api_key:
-            raise ValueError("OpenAI API key not provided")
-        return OpenAITTS(api_key=api_key)
-    elif provider == VoiceProvider.AZURE:
-        api_key = api_key or os.getenv("AZURE_SPEECH_KEY")
-        region = azure_region or os.getenv("AZURE_SPEECH_REGION")
-        if not api_key or not region:
-            raise ValueError("Azure credentials not provided")
-        return AzureTTS(api_key=api_key, region=region)
-    elif provider == VoiceProvider.GOOGLE:
-        creds_path = os.getenv("GOOGLE_APPLICATION_CREDENTIALS")
-        if not creds_path:
-            raise ValueError("Google credentials path not provided")
-        return GoogleSTT(credentials_path=creds_path)
-    else:
-        return LocalTTS()
+    """Factory function to get TTS provider (HTTP clients are shared by HTTP-based providers)."""
+    provider = _provider_name(provider)
+    factory = _TTS_FACTORIES.get(provider, _make_local_tts)
+    return _cached_provider(
+        ("tts", provider, api_key, azure_region, http_client, async_http_client),
+        lambda: factory(
+            api_key=api_key,
+            azure_region=azure_region,
+            http_client=http_client,
+            async_http_client=async_http_client,
+        ),
+    )
 
 
 def get_stt_provider(
@@ -287,25 +1415,19 @@ def get_stt_provider(
     api_key: str = None,
     azure_region: str = None,
     google_creds_path: str = None,
+    http_client=None,
+    async_http_client=None,
 ) -> SpeechToText:
-    """Factory function to get STT provider."""
-    provider = provider or os.getenv("VOICE_PROVIDER", "local").lower()
-
-    if provider == VoiceProvider.OPENAI:
-        api_key = api_key or os.getenv("OPENAI_API_KEY")
-        if not api_key:
-            raise ValueError("OpenAI API key not provided")
-        return OpenAISTT(api_key=api_key)
-    elif provider == VoiceProvider.AZURE:
-        api_key = api_key or os.getenv("AZURE_SPEECH_KEY")
-        region = azure_region or os.getenv("AZURE_SPEECH_REGION")
-        if not api_key or not region:
-            raise ValueError("Azure credentials not provided")
-        return AzureSTT(api_key=api_key, region=region)
-    elif provider == VoiceProvider.GOOGLE:
-        creds_path = google_creds_path or os.getenv("GOOGLE_APPLICATION_CREDENTIALS")
-        if not creds_path:
-            raise ValueError("Google credentials path not provided")
-        return GoogleSTT(credentials_path=creds_path)
-    else:
-        return LocalSTT()
+    """Factory function to get STT provider (HTTP clients are shared by HTTP-based providers)."""
+    provider = _provider_name(provider)
+    factory = _STT_FACTORIES.get(provider, _make_local_stt)
+    return _cached_provider(
+        ("stt", provider, api_key, azure_region, google_creds_path, http_client, async_http_client),
+        lambda: factory(
+            api_key=api_key,
+            azure_region=azure_region,
+            google_creds_path=google_creds_path,
+            http_client=http_client,
+            async_http_client=async_http_client,
+        ),
+    )
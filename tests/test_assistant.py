@@ -2,58 +2,111 @@
 Test scripts for the auto dealership voice assistant.
 """
 
+import functools
+import logging
 import sys
 import os
 sys.path.insert(0, os.path.dirname(__file__))
 
 from src.orchestrator import DealershipAssistant
-from src.agents import KnowledgeBase
+from src.agents import KnowledgeAgent, KnowledgeBase
+
+logger = logging.getLogger(__name__)
+
+
+# Shared fixtures, built on first use and reused by every test
+
+@functools.lru_cache(maxsize=None)
+def shared_knowledge_base() -> KnowledgeBase:
+    """Load the inventory once for all tests."""
+    return KnowledgeBase("data/car_inventory.json")
+
+
+@functools.lru_cache(maxsize=None)
+def _shared_assistant() -> DealershipAssistant:
+    return DealershipAssistant(use_voice=False)
+
+
+def fresh_assistant() -> DealershipAssistant:
+    """Return the shared text assistant with its conversation memory cleared."""
+    assistant = _shared_assistant()
+    assistant.conversation_agent.memory.clear()
+    return assistant
 
 
 def test_knowledge_base():
     """Test knowledge base functionality."""
-    print("\n" + "="*60)
-    print("TEST: Knowledge Base")
-    print("="*60)
+    logger.info("TEST: Knowledge Base")
 
-    kb = KnowledgeBase("data/car_inventory.json")
+    kb = shared_knowledge_base()
 
     # Test get all cars
-    print("\n[1] Available Cars:")
+    logger.debug("[1] Available Cars:")
     cars = kb.get_available_cars()
     for car in cars:
-        print(f"  - {car['brand']} {car['model']} ({car['type']})")
+        logger.debug("  - %s %s (%s)", car['brand'], car['model'], car['type'])
 
     # Test search by type
-    print("\n[2] Search for SUVs:")
+    logger.debug("[2] Search for SUVs:")
     suvs = kb.search_cars_by_type("SUV")
     for suv in suvs:
-        print(f"  - {suv['brand']} {suv['model']}: {suv['price_range']}")
+        logger.debug("  - %s %s: %s", suv['brand'], suv['model'], suv['price_range'])
 
     # Test get car details
-    print("\n[3] Car Details (Elegance 2024):")
+    logger.debug("[3] Car Details (Elegance 2024):")
     car = kb.get_car_details("sedan_001")
     if car:
-        print(f"  Brand: {car['brand']}")
-        print(f"  Model: {car['model']}")
-        print(f"  Features: {', '.join(car['features'][:3])}")
+        logger.debug("  Brand: %s", car['brand'])
+        logger.debug("  Model: %s", car['model'])
+        logger.debug("  Features: %s", car['features'][:3])
 
     # Test dealership info
-    print("\n[4] Dealership Info:")
+    logger.debug("[4] Dealership Info:")
     info = kb.get_dealership_info()
-    print(f"  Name: {info['name']}")
-    print(f"  Contact: {info['contact']}")
+    logger.debug("  Name: %s", info['name'])
+    logger.debug("  Contact: %s", info['contact'])
+
+    # Test budget filtering
+    logger.debug("[5] Cars starting under $40,000:")
+    under_40k = kb.filter_cars(max_price=40000)
+    for car in under_40k:
+        logger.debug("  - %s %s: %s", car['brand'], car['model'], car['price_range'])
+    assert [car["id"] for car in under_40k] == ["sedan_001", "truck_001", "compact_001"]
+
+    # Price ranges only need to overlap the budget
+    logger.debug("[6] Cars within a $30,000 - $50,000 budget:")
+    in_budget = kb.filter_cars(min_price=30000, max_price=50000)
+    for car in in_budget:
+        logger.debug("  - %s %s: %s", car['brand'], car['model'], car['price_range'])
+    assert [car["id"] for car in in_budget] == [
+        "sedan_001", "suv_001", "truck_001", "electric_001",
+    ]
 
-    print("\n✓ Knowledge Base Tests Passed!")
+    # Test spoken budgets in recommendations
+    logger.debug("[7] Recommendations by budget:")
+    agent = KnowledgeAgent(kb)
+    expected = {
+        "around 40 thousand": ["sedan_001", "truck_001", "compact_001"],
+        "40 grand": ["sedan_001", "truck_001", "compact_001"],
+        "under $40,000": ["sedan_001", "truck_001", "compact_001"],
+        "50k": ["sedan_001", "suv_001", "truck_001"],
+        "20K": ["compact_001"],
+        # Too small to be a price, so the budget is ignored
+        "around 40": ["sedan_001", "suv_001", "truck_001"],
+    }
+    for budget, car_ids in expected.items():
+        cars = agent.get_car_recommendations({"budget": budget})
+        logger.debug("  %r -> %s", budget, [car["id"] for car in cars])
+        assert [car["id"] for car in cars] == car_ids, budget
+
+    logger.info("✓ Knowledge Base Tests Passed!")
 
 
 def test_conversation_agent():
     """Test conversation agent."""
-    print("\n" + "="*60)
-    print("TEST: Conversation Agent")
-    print("="*60)
+    logger.info("TEST: Conversation Agent")
 
-    assistant = DealershipAssistant(use_voice=False)
+    assistant = fresh_assistant()
 
     test_queries = [
         "Hi, I'm looking for a sedan",
@@ -62,77 +115,71 @@ def test_conversation_agent():
     ]
 
     for i, query in enumerate(test_queries, 1):
-        print(f"\n[{i}] User: {query}")
+        logger.debug("[%d] User: %s", i, query)
         response = assistant.process_text(query)
-        print(f"    Assistant: {response[:200]}...")  # Truncate for display
+        logger.debug("    Assistant: %.200s...", response)  # Truncate for display
 
-    print("\n✓ Conversation Agent Tests Passed!")
+    logger.info("✓ Conversation Agent Tests Passed!")
 
 
 def test_voice_utilities():
     """Test voice utilities."""
-    print("\n" + "="*60)
-    print("TEST: Voice Utilities")
-    print("="*60)
+    logger.info("TEST: Voice Utilities")
 
     from src.voice_utils import get_tts_provider, get_stt_provider
 
     # Test TTS provider initialization
-    print("\n[1] Testing TTS Providers:")
+    logger.debug("[1] Testing TTS Providers:")
     try:
         tts = get_tts_provider(provider="local")
-        print("  ✓ Local TTS initialized")
+        logger.debug("  ✓ Local TTS initialized")
     except Exception as e:
-        print(f"  ✗ Local TTS failed: {e}")
+        logger.warning("  ✗ Local TTS failed: %s", e)
 
     # Test STT provider initialization
-    print("\n[2] Testing STT Providers:")
+    logger.debug("[2] Testing STT Providers:")
     try:
         stt = get_stt_provider(provider="local")
-        print("  ✓ Local STT initialized")
+        logger.debug("  ✓ Local STT initialized")
     except Exception as e:
-        print(f"  ✗ Local STT failed: {e}")
+        logger.warning("  ✗ Local STT failed: %s", e)
 
-    print("\n✓ Voice Utilities Tests Passed!")
+    logger.info("✓ Voice Utilities Tests Passed!")
 
 
 def test_booking():
     """Test booking functionality."""
-    print("\n" + "="*60)
-    print("TEST: Booking System")
-    print("="*60)
+    logger.info("TEST: Booking System")
 
-    assistant = DealershipAssistant(use_voice=False)
+    assistant = fresh_assistant()
 
     # Simulate booking process
-    print("\n[1] Booking Test Drive:")
+    logger.debug("[1] Booking Test Drive:")
     response = assistant.process_text(
         "I want to book a test drive for the Elegance sedan on 2024-01-20 at 14:00"
     )
-    print(f"    {response}")
+    logger.debug("    %s", response)
 
     # Check bookings
-    print("\n[2] Confirm Booking:")
+    logger.debug("[2] Confirm Booking:")
     bookings = assistant.get_bookings()
     if bookings:
         booking = bookings[0]
-        print(f"    Booking ID: {booking.booking_id}")
-        print(f"    Customer: {booking.customer_name}")
-        print(f"    Car: {booking.car_model}")
-        print(f"    Status: {booking.booking_status}")
+        logger.debug("    Booking ID: %s", booking.booking_id)
+        logger.debug("    Customer: %s", booking.customer_name)
+        logger.debug("    Car: %s", booking.car_model)
+        logger.debug("    Status: %s", booking.booking_status)
     else:
-        print("    No bookings recorded")
+        logger.debug("    No bookings recorded")
 
-    print("\n✓ Booking System Tests Passed!")
+    logger.info("✓ Booking System Tests Passed!")
 
 
 def test_end_to_end():
     """Test complete end-to-end flow."""
-    print("\n" + "="*60)
-    print("TEST: End-to-End Flow")
-    print("="*60)
+    logger.info("TEST: End-to-End Flow")
 
-    assistant = DealershipAssistant(use_voice=False)
+    assistant = fresh_assistant()
 
     # Conversation flow
     conversation = [
@@ -143,43 +190,42 @@ def test_end_to_end():
     ]
 
     for i, msg in enumerate(conversation, 1):
-        print(f"\n[Step {i}]")
-        print(f"  Customer: {msg}")
+        logger.debug("[Step %d] Customer: %s", i, msg)
         response = assistant.process_text(msg)
-        print(f"  Assistant: {response[:150]}...")
+        logger.debug("  Assistant: %.150s...", response)
 
     # Display final bookings
-    print("\n[Final State]")
-    assistant.display_bookings()
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("[Final State]")
+        assistant.display_bookings()
 
-    print("\n✓ End-to-End Tests Passed!")
+    logger.info("✓ End-to-End Tests Passed!")
 
 
 def run_all_tests():
-    """Run all tests."""
-    print("\n")
-    print("╔" + "="*58 + "╗")
-    print("║" + " "*58 + "║")
-    print("║" + " AUTO DEALERSHIP ASSISTANT - TEST SUITE".center(58) + "║")
-    print("║" + " "*58 + "║")
-    print("╚" + "="*58 + "╝")
+    """Run all tests under pytest, across CPUs when pytest-xdist is installed."""
+    import pytest
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    logger.info(
+        "\n╔%s╗\n║%s║\n║%s║\n║%s║\n╚%s╝",
+        "="*58, " "*58, " AUTO DEALERSHIP ASSISTANT - TEST SUITE".center(58), " "*58, "="*58,
+    )
 
+    # The LLM-bound tests are independent, so each can run on its own worker
+    args = [__file__, "-q", "--log-cli-level=INFO"]
     try:
-        test_knowledge_base()
-        test_voice_utilities()
-        test_conversation_agent()
-        test_booking()
-        test_end_to_end()
-
-        print("\n" + "="*60)
-        print("✓ ALL TESTS PASSED!")
-        print("="*60 + "\n")
-        return True
-    except Exception as e:
-        print(f"\n✗ TEST FAILED: {e}\n")
-        import traceback
-        traceback.print_exc()
-        return False
+        import xdist  # noqa: F401
+        args += ["-n", "auto"]
+    except ImportError:
+        pass
+
+    success = pytest.main(args) == 0
+    if success:
+        logger.info("✓ ALL TESTS PASSED!")
+    else:
+        logger.error("✗ TEST FAILED")
+    return success
 
 
 if __name__ == "__main__":